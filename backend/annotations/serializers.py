@@ -1,11 +1,16 @@
+from operator import itemgetter
+
 from rest_framework import serializers
 
 from datasets.serializers import MiniUserSerializer
-from .models import Annotation, AnnotationVersion, DraftAnnotation
+from .models import Annotation, AnnotationVersion
 
 
 class AnnotationSerializer(serializers.ModelSerializer):
-    class_color = serializers.SerializerMethodField()
+    # Falls back to the default when annotation_class is null
+    class_color = serializers.CharField(
+        source="annotation_class.color", default="#888888", read_only=True
+    )
     class_display_label = serializers.SerializerMethodField()
 
     class Meta:
@@ -25,11 +30,6 @@ class AnnotationSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = fields
 
-    def get_class_color(self, obj):
-        if obj.annotation_class:
-            return obj.annotation_class.color
-        return "#888888"
-
     def get_class_display_label(self, obj):
         if obj.annotation_class:
             return obj.annotation_class.display_label
@@ -73,39 +73,17 @@ class JobForAnnotationSerializer(serializers.Serializer):
         return f"/api/annotations/jobs/{obj.id}/raw-content/"
 
     def get_latest_annotations(self, obj):
-        latest_version = (
-            obj.annotation_versions.order_by("-version_number").first()
-        )
-        if latest_version:
+        # Expects obj.latest_versions prefetched by the view
+        if obj.latest_versions:
             return AnnotationSerializer(
-                latest_version.annotations.select_related("annotation_class").all(),
+                obj.latest_versions[0].annotations.all(),
                 many=True,
             ).data
         return []
 
     def get_rework_info(self, obj):
-        if obj.status not in ("QA_REJECTED", "ANNOTATION_IN_PROGRESS"):
-            return None
-        latest_review = (
-            obj.qa_reviews.order_by("-version_number").first()
-        )
-        if not latest_review or latest_review.decision != "REJECT":
-            return None
-        return {
-            "comments": latest_review.comments,
-            "reviewer_name": latest_review.reviewed_by.name if latest_review.reviewed_by else None,
-            "reviewer_id": str(latest_review.reviewed_by.id) if latest_review.reviewed_by else None,
-            "reviewed_at": latest_review.reviewed_at.isoformat(),
-        }
-
-
-class SaveDraftSerializer(serializers.Serializer):
-    annotations = serializers.JSONField()
-
-    def validate_annotations(self, value):
-        if not isinstance(value, list):
-            raise serializers.ValidationError("Must be a list.")
-        return value
+        # Built in bulk by the view, keyed by job id
+        return self.context.get("rework_map", {}).get(obj.id)
 
 
 class SubmitAnnotationSerializer(serializers.Serializer):
@@ -114,27 +92,34 @@ class SubmitAnnotationSerializer(serializers.Serializer):
         allow_empty=True,
     )
 
+    # Fetches every required field with one C-level call per annotation; a
+    # KeyError names the first missing field in this order.
+    _get_required_fields = itemgetter(
+        "annotation_class",
+        "tag",
+        "section_index",
+        "start_offset",
+        "end_offset",
+        "original_text",
+    )
+
     def validate_annotations(self, value):
+        if not value:
+            return value
         min_length = self.context.get("min_annotation_length", 1)
+        get_required = self._get_required_fields
         for i, ann in enumerate(value):
-            required_fields = [
-                "annotation_class",
-                "tag",
-                "section_index",
-                "start_offset",
-                "end_offset",
-                "original_text",
-            ]
-            for field in required_fields:
-                if field not in ann:
-                    raise serializers.ValidationError(
-                        f"Annotation {i}: missing field '{field}'."
-                    )
-            if ann["start_offset"] >= ann["end_offset"]:
+            try:
+                _, _, _, start_offset, end_offset, original_text = get_required(ann)
+            except KeyError as exc:
+                raise serializers.ValidationError(
+                    f"Annotation {i}: missing field '{exc.args[0]}'."
+                )
+            if start_offset >= end_offset:
                 raise serializers.ValidationError(
                     f"Annotation {i}: start_offset must be less than end_offset."
                 )
-            stripped = ann["original_text"].strip()
+            stripped = original_text.strip()
             if not stripped:
                 raise serializers.ValidationError(
                     f"Annotation {i}: original_text cannot be empty or blank."
@@ -144,44 +129,3 @@ class SubmitAnnotationSerializer(serializers.Serializer):
                     f"Annotation {i}: original_text must be at least {min_length} characters (got {len(stripped)})."
                 )
         return value
-
-
-class MyAnnotationJobsSerializer(serializers.Serializer):
-    id = serializers.UUIDField()
-    dataset = serializers.UUIDField(source="dataset_id")
-    dataset_name = serializers.CharField(source="dataset.name")
-    file_name = serializers.CharField()
-    status = serializers.CharField()
-    discard_reason = serializers.CharField()
-    created_at = serializers.DateTimeField()
-    updated_at = serializers.DateTimeField()
-    annotation_count = serializers.SerializerMethodField()
-    rework_info = serializers.SerializerMethodField()
-
-    def get_annotation_count(self, obj):
-        latest_version = (
-            obj.annotation_versions.order_by("-version_number").first()
-        )
-        if latest_version:
-            return latest_version.annotations.count()
-        # Fall back to draft annotation count
-        try:
-            draft = obj.draft_annotation
-        except DraftAnnotation.DoesNotExist:
-            return 0
-        return len(draft.annotations) if draft and draft.annotations else 0
-
-    def get_rework_info(self, obj):
-        if obj.status not in ("QA_REJECTED", "ANNOTATION_IN_PROGRESS"):
-            return None
-        latest_review = (
-            obj.qa_reviews.order_by("-version_number").first()
-        )
-        if not latest_review or latest_review.decision != "REJECT":
-            return None
-        return {
-            "comments": latest_review.comments,
-            "reviewer_name": latest_review.reviewed_by.name if latest_review.reviewed_by else None,
-            "reviewer_id": str(latest_review.reviewed_by.id) if latest_review.reviewed_by else None,
-            "reviewed_at": latest_review.reviewed_at.isoformat(),
-        }
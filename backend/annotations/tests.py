@@ -1,3 +1,82 @@
 from django.test import TestCase
 
-# Create your tests here.
+from accounts.models import User
+from datasets.models import Dataset, Job
+
+from .models import Annotation, AnnotationVersion
+
+
+class SubmitAnnotationTests(TestCase):
+    def setUp(self):
+        self.annotator = User.objects.create_user(
+            "annotator@example.com", "Annotator", "pw", role="ANNOTATOR"
+        )
+        dataset = Dataset.objects.create(name="dataset")
+        self.job = Job(
+            dataset=dataset,
+            file_name="a.eml",
+            assigned_annotator=self.annotator,
+            status=Job.Status.ANNOTATION_IN_PROGRESS,
+        )
+        self.job.eml_content = "From: a@example.com\r\n\r\nHello\r\n"
+        self.job.save()
+        self.client.force_login(self.annotator)
+
+    def _submit(self):
+        return self.client.post(
+            f"/api/annotations/jobs/{self.job.id}/submit/",
+            {"annotations": []},
+            content_type="application/json",
+        )
+
+    def test_version_numbers_increment(self):
+        for _ in range(2):
+            Job.objects.filter(id=self.job.id).update(
+                status=Job.Status.ANNOTATION_IN_PROGRESS
+            )
+            response = self._submit()
+            self.assertEqual(response.status_code, 201)
+        version_numbers = AnnotationVersion.objects.filter(job=self.job).values_list(
+            "version_number", flat=True
+        )
+        self.assertEqual(sorted(version_numbers), [1, 2])
+
+
+class MyJobsTests(TestCase):
+    def setUp(self):
+        self.annotator = User.objects.create_user(
+            "annotator@example.com", "Annotator", "pw", role="ANNOTATOR"
+        )
+        self.job = Job(
+            dataset=Dataset.objects.create(name="dataset"),
+            file_name="a.eml",
+            assigned_annotator=self.annotator,
+            status=Job.Status.SUBMITTED_FOR_QA,
+        )
+        self.job.eml_content = "From: a@example.com\r\n\r\nHello\r\n"
+        self.job.save()
+        self.client.force_login(self.annotator)
+
+    def test_annotation_count_uses_latest_version(self):
+        for version_number, count in ((1, 3), (2, 1)):
+            version = AnnotationVersion.objects.create(
+                job=self.job,
+                version_number=version_number,
+                created_by=self.annotator,
+                source=AnnotationVersion.Source.ANNOTATOR,
+            )
+            Annotation.objects.bulk_create(
+                Annotation(
+                    annotation_version=version,
+                    class_name="email",
+                    tag="[email_1]",
+                    start_offset=0,
+                    end_offset=1,
+                    original_text="a",
+                )
+                for _ in range(count)
+            )
+        response = self.client.get("/api/annotations/my-jobs/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["count"], 1)
+        self.assertEqual(response.json()["results"][0]["annotation_count"], 1)
@@ -1,30 +1,78 @@
 from django.db import transaction
-from django.db.models import Count, Max
+from django.db.models import (
+    Count,
+    Max,
+    OuterRef,
+    Prefetch,
+    Q,
+    Subquery,
+    TextField,
+    prefetch_related_objects,
+)
+from django.db.models.functions import Cast, Coalesce
 from rest_framework import status
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import ViewSet
 
-from core.models import PlatformSetting
 from core.section_extractor import extract_sections
-from core.settings_views import get_discard_reasons
+from core.settings_views import get_discard_reasons, get_min_annotation_length
 from core.permissions import IsAnnotator
 from datasets.models import Job
+from qa.models import QAReviewVersion
 from .models import Annotation, AnnotationVersion, DraftAnnotation
 from .serializers import (
     JobForAnnotationSerializer,
-    MyAnnotationJobsSerializer,
-    SaveDraftSerializer,
     SubmitAnnotationSerializer,
 )
 
 
+REWORK_STATUSES = (Job.Status.QA_REJECTED, Job.Status.ANNOTATION_IN_PROGRESS)
+
+
+def _get_rework_info_map(job_ids):
+    """Map job id -> rework info for jobs whose latest QA review is a rejection.
+
+    Single query; only latest reviews that are rejections are loaded, so
+    jobs whose latest review was accepted cost nothing.
+    """
+    if not job_ids:
+        return {}
+    latest_rejections = QAReviewVersion.objects.filter(
+        job_id__in=job_ids,
+        id=Subquery(
+            QAReviewVersion.objects.filter(job_id=OuterRef("job_id"))
+            .order_by("-version_number")
+            .values("id")[:1]
+        ),
+        decision=QAReviewVersion.Decision.REJECT,
+    ).values(
+        "job_id",
+        "comments",
+        "reviewed_at",
+        "reviewed_by__name",
+        # Let the database render the UUID (uuid::text on PostgreSQL)
+        reviewer_id=Cast("reviewed_by", output_field=TextField()),
+    )
+    return {
+        row["job_id"]: {
+            "comments": row["comments"],
+            "reviewer_name": row["reviewed_by__name"],
+            "reviewer_id": row["reviewer_id"],
+            "reviewed_at": row["reviewed_at"].isoformat(),
+        }
+        for row in latest_rejections
+    }
+
+
 class AnnotationJobsPagination(PageNumberPagination):
     page_size = 20
     page_size_query_param = "page_size"
     max_page_size = 100
-    status_counts = None
+
+    def __init__(self, status_counts=None):
+        self.status_counts = status_counts
 
     def get_paginated_response(self, data):
         response = super().get_paginated_response(data)
@@ -37,31 +85,60 @@ class AnnotationViewSet(ViewSet):
     permission_classes = [IsAuthenticated, IsAnnotator]
 
     def _get_min_annotation_length(self):
-        try:
-            setting = PlatformSetting.objects.get(key="min_annotation_length")
-            return max(1, int(setting.value))
-        except (PlatformSetting.DoesNotExist, ValueError):
-            return 1
+        return get_min_annotation_length()
+
+    def _job_access_error(self, assigned_annotator_id, job_status, user, allowed_statuses):
+        """Return an error response if the user may not act on the job, else None."""
+        if assigned_annotator_id != user.id:
+            return Response(
+                {"detail": "You are not assigned to this job."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+        if allowed_statuses and job_status not in allowed_statuses:
+            return Response(
+                {"detail": f"Job status '{job_status}' is not valid for this action."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return None
+
+    def _check_job_access(self, job_id, user, allowed_statuses=None):
+        """Validate assignment without loading a Job instance.
+
+        For endpoints that only need the job id. Returns an error response,
+        or None when access is allowed.
+        """
+        row = (
+            Job.objects.filter(id=job_id)
+            .values_list("assigned_annotator_id", "status")
+            .first()
+        )
+        if row is None:
+            return Response(
+                {"detail": "Job not found."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return self._job_access_error(*row, user, allowed_statuses)
 
-    def _get_job(self, job_id, user, allowed_statuses=None):
-        """Fetch a job and validate assignment. Returns (job, error_response)."""
+    def _get_job(self, job_id, user, allowed_statuses=None, queryset=None):
+        """Fetch a job and validate assignment. Returns (job, error_response).
+
+        The default queryset skips the compressed .eml column; pass a queryset
+        that loads it when the email content is needed.
+        """
+        if queryset is None:
+            queryset = Job.objects.select_related("dataset").defer("eml_content_compressed")
         try:
-            job = Job.objects.select_related("dataset").get(id=job_id)
+            job = queryset.get(id=job_id)
         except Job.DoesNotExist:
             return None, Response(
                 {"detail": "Job not found."},
                 status=status.HTTP_404_NOT_FOUND,
             )
-        if job.assigned_annotator_id != user.id:
-            return None, Response(
-                {"detail": "You are not assigned to this job."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-        if allowed_statuses and job.status not in allowed_statuses:
-            return None, Response(
-                {"detail": f"Job status '{job.status}' is not valid for this action."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+        err = self._job_access_error(
+            job.assigned_annotator_id, job.status, user, allowed_statuses
+        )
+        if err:
+            return None, err
         return job, None
 
     def get_job(self, request, job_id):
@@ -79,14 +156,60 @@ class AnnotationViewSet(ViewSet):
         job, err = self._get_job(job_id, request.user, allowed)
         if err:
             return err
+        # Load only the latest annotation version (with its annotations) so
+        # the serializer issues no further queries.
+        prefetch_related_objects(
+            [job],
+            Prefetch(
+                "annotation_versions",
+                queryset=AnnotationVersion.objects.filter(
+                    id=Subquery(
+                        AnnotationVersion.objects.filter(job_id=OuterRef("job_id"))
+                        .order_by("-version_number")
+                        .values("id")[:1]
+                    )
+                ).prefetch_related(
+                    Prefetch(
+                        "annotations",
+                        queryset=Annotation.objects.select_related(
+                            "annotation_class"
+                        ).only(
+                            "id",
+                            "annotation_version",
+                            "annotation_class",
+                            "class_name",
+                            "tag",
+                            "section_index",
+                            "start_offset",
+                            "end_offset",
+                            "original_text",
+                            "created_at",
+                            "annotation_class__color",
+                            "annotation_class__display_label",
+                        ),
+                    )
+                ),
+                to_attr="latest_versions",
+            ),
+        )
+        rework_map = {}
+        if job.status in REWORK_STATUSES:
+            rework_map = _get_rework_info_map([job.id])
         min_length = self._get_min_annotation_length()
         serializer = JobForAnnotationSerializer(
-            job, context={"min_annotation_length": min_length}
+            job,
+            context={"min_annotation_length": min_length, "rework_map": rework_map},
         )
         return Response(serializer.data)
 
     def get_raw_content(self, request, job_id):
-        job, err = self._get_job(job_id, request.user)
+        job, err = self._get_job(
+            job_id,
+            request.user,
+            queryset=Job.objects.only(
+                "status", "assigned_annotator", "eml_content_compressed"
+            ),
+        )
         if err:
             return err
         if not job.eml_content:
@@ -110,28 +233,37 @@ class AnnotationViewSet(ViewSet):
         })
 
     def get_draft(self, request, job_id):
-        job, err = self._get_job(job_id, request.user)
+        err = self._check_job_access(job_id, request.user)
         if err:
             return err
         try:
-            draft = DraftAnnotation.objects.get(job=job)
+            draft = DraftAnnotation.objects.get(job_id=job_id)
             return Response({"annotations": draft.annotations})
         except DraftAnnotation.DoesNotExist:
             return Response({"annotations": []})
 
     def save_draft(self, request, job_id):
-        job, err = self._get_job(
+        err = self._check_job_access(
             job_id,
             request.user,
             [Job.Status.ANNOTATION_IN_PROGRESS],
         )
         if err:
             return err
-        serializer = SaveDraftSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        DraftAnnotation.objects.update_or_create(
-            job=job,
-            defaults={"annotations": serializer.validated_data["annotations"]},
+        # request.data is already decoded JSON, so the draft is stored as-is
+        # rather than re-serialised by a JSONField just to validate it.
+        annotations = request.data.get("annotations") if isinstance(request.data, dict) else None
+        if not isinstance(annotations, list):
+            return Response(
+                {"annotations": ["Must be a list."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        # Upsert draft
+        DraftAnnotation.objects.bulk_create(
+            [DraftAnnotation(job_id=job_id, annotations=annotations)],
+            update_conflicts=True,
+            unique_fields=["job"],
+            update_fields=["annotations", "updated_at"],
         )
         return Response({"detail": "Draft saved."})
 
@@ -140,7 +272,7 @@ class AnnotationViewSet(ViewSet):
             try:
                 job = (
                     Job.objects.select_for_update()
-                    .select_related("dataset")
+                    .only("status", "assigned_annotator")
                     .get(id=job_id)
                 )
             except Job.DoesNotExist:
@@ -176,7 +308,7 @@ class AnnotationViewSet(ViewSet):
         try:
             job = (
                 Job.objects.select_for_update()
-                .select_related("dataset")
+                .only("status", "assigned_annotator")
                 .get(id=job_id)
             )
         except Job.DoesNotExist:
@@ -236,7 +368,7 @@ class AnnotationViewSet(ViewSet):
             )
             for ann in annotations_data
         ]
-        Annotation.objects.bulk_create(annotation_objects)
+        Annotation.objects.bulk_create(annotation_objects, batch_size=500)
 
         # Delete draft
         DraftAnnotation.objects.filter(job=job).delete()
@@ -274,7 +406,7 @@ class AnnotationViewSet(ViewSet):
             try:
                 job = (
                     Job.objects.select_for_update()
-                    .select_related("dataset")
+                    .only("status", "assigned_annotator")
                     .get(id=job_id)
                 )
             except Job.DoesNotExist:
@@ -309,20 +441,34 @@ class AnnotationViewSet(ViewSet):
         return Response({"detail": "Job discarded.", "status": job.status})
 
     def my_jobs(self, request):
+        latest_version_id = Subquery(
+            AnnotationVersion.objects.filter(job=OuterRef("pk"))
+            .order_by("-version_number")
+            .values("id")[:1]
+        )
+        latest_annotation_count = Subquery(
+            Annotation.objects.filter(annotation_version=OuterRef("latest_version_id"))
+            .order_by()
+            .values("annotation_version")
+            .annotate(count=Count("id"))
+            .values("count")
+        )
         base_queryset = (
             Job.objects.filter(assigned_annotator=request.user)
-            .select_related("dataset")
-            .prefetch_related("draft_annotation")
+            .annotate(latest_version_id=latest_version_id)
+            .annotate(annotation_count=Coalesce(latest_annotation_count, 0))
             .order_by("-updated_at")
         )
 
-        # Compute status counts from unfiltered base queryset
-        status_counts_qs = (
-            Job.objects.filter(assigned_annotator=request.user)
-            .values("status")
-            .annotate(count=Count("id"))
+        # Compute status counts from unfiltered base queryset (one conditional
+        # aggregate); statuses with no jobs are omitted as before.
+        counts = Job.objects.filter(assigned_annotator=request.user).aggregate(
+            **{
+                job_status: Count("id", filter=Q(status=job_status))
+                for job_status in Job.Status.values
+            }
         )
-        status_counts = {row["status"]: row["count"] for row in status_counts_qs}
+        status_counts = {job_status: n for job_status, n in counts.items() if n}
 
         # Filters
         queryset = base_queryset
@@ -337,8 +483,54 @@ class AnnotationViewSet(ViewSet):
         if search:
             queryset = queryset.filter(file_name__icontains=search)
 
-        paginator = AnnotationJobsPagination()
-        paginator.status_counts = status_counts
-        page = paginator.paginate_queryset(queryset, request)
-        serializer = MyAnnotationJobsSerializer(page, many=True)
-        return paginator.get_paginated_response(serializer.data)
+        paginator = AnnotationJobsPagination(status_counts=status_counts)
+        page = paginator.paginate_queryset(
+            queryset.values(
+                "id",
+                "dataset_id",
+                "dataset__name",
+                "file_name",
+                "status",
+                "discard_reason",
+                "created_at",
+                "updated_at",
+                "latest_version_id",
+                "annotation_count",
+            ),
+            request,
+        )
+
+        # Jobs without a submitted version report their draft size instead
+        draft_job_ids = [row["id"] for row in page if row["latest_version_id"] is None]
+        draft_counts = {}
+        if draft_job_ids:
+            draft_counts = {
+                job_id: len(annotations) if annotations else 0
+                for job_id, annotations in DraftAnnotation.objects.filter(
+                    job_id__in=draft_job_ids
+                ).values_list("job_id", "annotations")
+            }
+
+        rework_map = _get_rework_info_map(
+            [row["id"] for row in page if row["status"] in REWORK_STATUSES]
+        )
+
+        results = []
+        for row in page:
+            if row["latest_version_id"] is not None:
+                annotation_count = row["annotation_count"]
+            else:
+                annotation_count = draft_counts.get(row["id"], 0)
+            results.append({
+                "id": row["id"],
+                "dataset": row["dataset_id"],
+                "dataset_name": row["dataset__name"],
+                "file_name": row["file_name"],
+                "status": row["status"],
+                "discard_reason": row["discard_reason"],
+                "created_at": row["created_at"],
+                "updated_at": row["updated_at"],
+                "annotation_count": annotation_count,
+                "rework_info": rework_map.get(row["id"]),
+            })
+        return paginator.get_paginated_response(results)
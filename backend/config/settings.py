@@ -112,6 +112,35 @@ if database_url := os.environ.get("DATABASE_URL"):
     DATABASES["default"] = dj_database_url.parse(database_url, conn_max_age=600)
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Local memory is per process, so PlatformSetting values are not cached with
+# it (see core.settings_views.shared_setting_cache). Set REDIS_URL to share
+# the cache across workers and cache settings too; that needs the redis
+# package, which is not installed by default.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+if redis_url := os.environ.get("REDIS_URL"):
+    import importlib.util
+
+    from django.core.exceptions import ImproperlyConfigured
+
+    # Fail at startup rather than on the first cache access
+    if importlib.util.find_spec("redis") is None:
+        raise ImproperlyConfigured(
+            "REDIS_URL is set but the redis package is not installed."
+        )
+    CACHES["default"] = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": redis_url,
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
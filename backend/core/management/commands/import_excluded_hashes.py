@@ -1,9 +1,11 @@
 import csv
-import re
 
 from django.core.management.base import BaseCommand
 
 from core.models import ExcludedFileHash
+from core.serializers import SHA256_HEX_RE
+
+BATCH_SIZE = 5000
 
 
 class Command(BaseCommand):
@@ -34,8 +36,6 @@ class Command(BaseCommand):
         note = options["note"]
         dry_run = options["dry_run"]
 
-        hex_pattern = re.compile(r"^[0-9a-f]{64}$")
-
         to_import = []
         seen_in_csv = set()
         csv_duplicates = 0
@@ -54,7 +54,7 @@ class Command(BaseCommand):
                 file_name = row[0].strip()
                 content_hash = row[1].strip().lower()
 
-                if not hex_pattern.match(content_hash):
+                if not SHA256_HEX_RE.match(content_hash):
                     errors.append(
                         f"Row {row_num}: invalid hash '{content_hash[:20]}...'"
                     )
@@ -67,12 +67,15 @@ class Command(BaseCommand):
                 seen_in_csv.add(content_hash)
                 to_import.append((file_name, content_hash))
 
-        # Check which already exist in DB
-        existing = set(
-            ExcludedFileHash.objects.filter(
-                content_hash__in=[h for _, h in to_import]
-            ).values_list("content_hash", flat=True)
-        )
+        # Check which already exist in DB, in batches to keep IN lists bounded
+        hashes = [h for _, h in to_import]
+        existing = set()
+        for i in range(0, len(hashes), BATCH_SIZE):
+            existing.update(
+                ExcludedFileHash.objects.filter(
+                    content_hash__in=hashes[i : i + BATCH_SIZE]
+                ).values_list("content_hash", flat=True)
+            )
 
         new_items = [(fn, h) for fn, h in to_import if h not in existing]
         already_existed = len(to_import) - len(new_items)
@@ -104,7 +107,9 @@ class Command(BaseCommand):
                 )
                 for file_name, content_hash in new_items
             ]
-            ExcludedFileHash.objects.bulk_create(objects, ignore_conflicts=True)
+            ExcludedFileHash.objects.bulk_create(
+                objects, batch_size=BATCH_SIZE, ignore_conflicts=True
+            )
             self.stdout.write(
                 self.style.SUCCESS(f"\nCreated {len(new_items)} excluded hash(es).")
             )
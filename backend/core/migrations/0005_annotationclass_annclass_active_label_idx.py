@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-16 11:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0004_alter_annotationclass_id_alter_excludedfilehash_id"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="annotationclass",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["display_label"],
+                name="annclass_active_label_idx",
+            ),
+        ),
+    ]
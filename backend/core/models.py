@@ -1,10 +1,25 @@
+import os
+import time
 import uuid
 from django.conf import settings
 from django.db import models
 
 
+def uuid7():
+    """Return a time-ordered RFC 9562 version 7 UUID.
+
+    New rows land at the right edge of the primary key index instead of at
+    random positions, as with uuid4.
+    """
+    unix_ms = time.time_ns() // 1_000_000
+    value = (unix_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10))
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 class AnnotationClass(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(max_length=100, unique=True)
     display_label = models.CharField(max_length=100)
     color = models.CharField(max_length=7)
@@ -17,6 +32,15 @@ class AnnotationClass(models.Model):
 
     class Meta:
         verbose_name_plural = "annotation classes"
+        indexes = [
+            # The serializers' uniqueness check only considers active classes;
+            # name is covered by its unique index, display_label needs this one
+            models.Index(
+                fields=["display_label"],
+                name="annclass_active_label_idx",
+                condition=models.Q(is_deleted=False),
+            ),
+        ]
 
     def __str__(self):
         return self.display_label
@@ -31,7 +55,7 @@ class PlatformSetting(models.Model):
 
 
 class ExcludedFileHash(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     content_hash = models.CharField(max_length=64, unique=True)
     file_name = models.CharField(max_length=255, blank=True, default="")
     note = models.TextField(blank=True, default="")
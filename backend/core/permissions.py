@@ -1,4 +1,4 @@
-from rest_framework.permissions import BasePermission
+from rest_framework.permissions import SAFE_METHODS, BasePermission
 
 
 class IsAdmin(BasePermission):
@@ -29,3 +29,10 @@ class IsAdminOrQA(BasePermission):
 class IsAnyRole(BasePermission):
     def has_permission(self, request, view):
         return request.user.is_authenticated and request.user.role in ("ADMIN", "ANNOTATOR", "QA")
+
+
+class IsAdminOrReadOnly(BasePermission):
+    def has_permission(self, request, view):
+        if request.method in SAFE_METHODS:
+            return True
+        return IsAdmin().has_permission(request, view)
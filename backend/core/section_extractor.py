@@ -8,10 +8,11 @@ correct MIME parsing, producing per-section content with \r-stripped text.
 import email
 import email.message
 import email.policy
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailSection:
     index: int  # 0-based
     section_type: str  # "HEADERS" | "TEXT_PLAIN" | "TEXT_HTML"
@@ -31,6 +32,17 @@ def extract_sections(raw_content: str) -> list[EmailSection]:
 
     All section content has \\r stripped for consistent browser-compatible offsets.
     """
+    return extract_sections_and_message(raw_content)[0]
+
+
+def extract_sections_and_message(
+    raw_content: str,
+) -> tuple[list[EmailSection], email.message.Message]:
+    """Like extract_sections(), but also return the parsed message.
+
+    Callers that go on to reassemble the email can pass the message to
+    deidentify_and_reassemble() instead of having it parsed a second time.
+    """
     sections: list[EmailSection] = []
 
     # Section 0: Headers
@@ -54,60 +66,92 @@ def extract_sections(raw_content: str) -> list[EmailSection]:
         section.index = i + 1  # 1-based for body sections
         sections.append(section)
 
-    return sections
+    return sections, msg
 
 
-def _extract_headers(raw_content: str) -> str:
-    """Extract everything before the first blank line and strip \\r."""
-    # Find the header/body separator (first blank line)
+def find_header_end(raw_content: str) -> int:
+    """Return the offset of the header/body separator (first blank line).
+
+    Returns len(raw_content) when there is no blank line, i.e. the entire
+    content is headers.
+    """
     for sep in ("\r\n\r\n", "\n\n"):
         pos = raw_content.find(sep)
         if pos != -1:
-            return raw_content[:pos].replace("\r", "")
-    # No blank line found — entire content is headers
-    return raw_content.replace("\r", "")
+            return pos
+    return len(raw_content)
+
+
+def _extract_headers(raw_content: str) -> str:
+    """Extract everything before the first blank line and strip \\r."""
+    return raw_content[: find_header_end(raw_content)].replace("\r", "")
+
+
+def iter_text_parts(
+    msg: email.message.Message,
+) -> Iterator[tuple[list[int], email.message.Message]]:
+    """Yield (mime_path, part) for each text/* leaf, depth-first.
+
+    Same order as msg.walk(), but iterative and tracking each leaf's position
+    in the MIME tree so reassembly can match parts back to sections.
+    """
+    stack = [([], msg)]
+    while stack:
+        path, part = stack.pop()
+        if part.is_multipart():
+            children = part.get_payload()
+            for i in range(len(children) - 1, -1, -1):
+                stack.append((path + [i], children[i]))
+            continue
+        # Skip non-text parts (images, attachments, etc.)
+        if part.get_content_type().startswith("text/"):
+            yield path, part
 
 
 def _extract_body_sections(msg: email.message.Message) -> list[EmailSection]:
     """Walk MIME tree and extract decoded text/* parts."""
     sections: list[EmailSection] = []
-    _walk_parts(msg, sections, path=[])
+    type_counts: dict[str, int] = {}
+    for path, part in iter_text_parts(msg):
+        _extract_part_section(part, sections, type_counts, path)
     return sections
 
 
-def _walk_parts(
+def _decode_without_cr(raw_bytes: bytes, charset: str) -> str:
+    """Decode payload bytes with every \\r removed.
+
+    For charsets where \\r is the single byte 0x0D (ASCII, UTF-8, Latin-1,
+    ...) the bytes are filtered before decoding, avoiding a second full-size
+    copy of the decoded text.
+    """
+    if "\r".encode(charset) == b"\r":
+        return raw_bytes.translate(None, b"\r").decode(charset, errors="replace")
+    return raw_bytes.decode(charset, errors="replace").replace("\r", "")
+
+
+def _extract_part_section(
     msg: email.message.Message,
     sections: list[EmailSection],
+    type_counts: dict[str, int],
     path: list[int],
 ) -> None:
-    """Recursively walk MIME parts, collecting text/* leaves."""
-    if msg.is_multipart():
-        for i, part in enumerate(msg.get_payload()):
-            _walk_parts(part, sections, path + [i])
-        return
-
-    content_type = msg.get_content_type() or ""
-    if not content_type.startswith("text/"):
-        return  # Skip non-text parts (images, attachments, etc.)
+    """Decode a text/* leaf and append it to sections.
 
+    type_counts tracks how many sections of each type were already added.
+    """
+    content_type = msg.get_content_type()
     charset = msg.get_content_charset() or "utf-8"
     cte = (msg.get("Content-Transfer-Encoding") or "7bit").strip().lower()
 
-    # Decode payload
+    # Decode payload, stripping \r for browser-compatible offsets
+    raw_bytes = msg.get_payload(decode=True)
+    if raw_bytes is None:
+        return
     try:
-        raw_bytes = msg.get_payload(decode=True)
-        if raw_bytes is None:
-            return
-        decoded_text = raw_bytes.decode(charset, errors="replace")
+        content = _decode_without_cr(raw_bytes, charset)
     except (LookupError, UnicodeDecodeError):
         # Unknown charset — try utf-8 fallback
-        raw_bytes = msg.get_payload(decode=True)
-        if raw_bytes is None:
-            return
-        decoded_text = raw_bytes.decode("utf-8", errors="replace")
-
-    # Strip \r for browser-compatible offsets
-    content = decoded_text.replace("\r", "")
+        content = _decode_without_cr(raw_bytes, "utf-8")
 
     # Determine section type and label
     if content_type == "text/plain":
@@ -121,7 +165,8 @@ def _walk_parts(
         label = f"{content_type} Body"
 
     # If there are multiple sections of the same type, add a suffix
-    existing_count = sum(1 for s in sections if s.section_type == section_type)
+    existing_count = type_counts.get(section_type, 0)
+    type_counts[section_type] = existing_count + 1
     if existing_count > 0:
         label = f"{label} ({existing_count + 1})"
 
@@ -5,18 +5,21 @@ Uses Python's email library for correct MIME handling instead of the
 regex-based approach in eml_normalizer.py.
 """
 
+import base64
 import email
 import email.message
 import email.encoders
+import quopri
 from collections import defaultdict
 
-from .section_extractor import EmailSection
+from .section_extractor import EmailSection, find_header_end, iter_text_parts
 
 
 def deidentify_and_reassemble(
     raw_content: str,
     sections: list[EmailSection],
     annotations_by_section: dict[int, list],
+    msg: email.message.Message | None = None,
 ) -> str:
     """Apply per-section deidentification and produce valid .eml output.
 
@@ -25,41 +28,36 @@ def deidentify_and_reassemble(
         sections: Parsed sections from extract_sections()
         annotations_by_section: Dict mapping section_index -> list of annotations
             Each annotation needs .start_offset, .end_offset, .tag, .class_name
+        msg: Message already parsed from raw_content, as returned by
+            extract_sections_and_message(). Reused (and modified in place)
+            unless the headers are rewritten, which requires a fresh parse.
 
     Returns:
         Valid .eml string with PII replaced by [TAG] placeholders
     """
     # --- Header deidentification via direct string splice ---
-    # Find header/body boundary in raw content
-    uses_crlf = "\r\n" in raw_content
-    for sep in ("\r\n\r\n", "\n\n"):
-        boundary_pos = raw_content.find(sep)
-        if boundary_pos != -1:
-            header_end = boundary_pos
-            body_start = boundary_pos + len(sep)
-            break
+    # extract_sections() always puts the headers first
+    if sections and sections[0].section_type == "HEADERS":
+        header_section, body_sections = sections[0], sections[1:]
     else:
-        # No blank line — entire content is headers
-        header_end = len(raw_content)
-        body_start = len(raw_content)
-
-    header_section = next((s for s in sections if s.section_type == "HEADERS"), None)
+        header_section, body_sections = None, sections
     header_anns = annotations_by_section.get(0, [])
 
     if header_section and header_anns:
         deidentified_headers = _apply_replacements(header_section.content, header_anns)
         # Convert back to original line ending style
-        if uses_crlf:
+        if "\r\n" in raw_content:
             deidentified_headers = deidentified_headers.replace("\n", "\r\n")
-        # Splice deidentified headers into raw content
+        # Splice deidentified headers into raw content, at the same boundary
+        # extract_sections() used for the header section
+        header_end = find_header_end(raw_content)
         modified_raw = deidentified_headers + raw_content[header_end:]
-    else:
-        modified_raw = raw_content
+        msg = email.message_from_string(modified_raw)
+    elif msg is None:
+        msg = email.message_from_string(raw_content)
 
     # --- Body deidentification via email library ---
-    msg = email.message_from_string(modified_raw)
-
-    body_sections = [s for s in sections if s.section_type != "HEADERS"]
+    # Parts without annotations keep their original payload and encoding
     if msg.is_multipart():
         _deidentify_multipart(msg, body_sections, annotations_by_section)
     elif body_sections:
@@ -68,8 +66,6 @@ def deidentify_and_reassemble(
         if anns:
             modified = _apply_replacements(section.content, anns)
             _set_part_payload(msg, modified, section)
-        else:
-            _set_part_payload(msg, section.content, section)
 
     return msg.as_string()
 
@@ -81,44 +77,19 @@ def _deidentify_multipart(
 ) -> None:
     """Apply deidentification to multipart message body parts."""
     # Build a map from mime_path to section
-    section_by_path = {}
-    for section in body_sections:
-        path_key = tuple(section.mime_path)
-        section_by_path[path_key] = section
+    section_by_path = {tuple(s.mime_path): s for s in body_sections}
 
-    _walk_and_deidentify(msg, section_by_path, annotations_by_section, path=[])
+    for path, part in iter_text_parts(msg):
+        section = section_by_path.get(tuple(path))
+        if not section:
+            continue
 
+        anns = annotations_by_section.get(section.index, [])
+        if not anns:
+            continue
 
-def _walk_and_deidentify(
-    msg: email.message.Message,
-    section_by_path: dict[tuple, EmailSection],
-    annotations_by_section: dict[int, list],
-    path: list[int],
-) -> None:
-    """Recursively walk and deidentify text parts."""
-    if msg.is_multipart():
-        for i, part in enumerate(msg.get_payload()):
-            _walk_and_deidentify(
-                part, section_by_path, annotations_by_section, path + [i]
-            )
-        return
-
-    content_type = msg.get_content_type() or ""
-    if not content_type.startswith("text/"):
-        return
-
-    path_key = tuple(path)
-    section = section_by_path.get(path_key)
-    if not section:
-        return
-
-    anns = annotations_by_section.get(section.index, [])
-    if anns:
         modified = _apply_replacements(section.content, anns)
-    else:
-        modified = section.content
-
-    _set_part_payload(msg, modified, section)
+        _set_part_payload(part, modified, section)
 
 
 def _set_part_payload(
@@ -127,9 +98,6 @@ def _set_part_payload(
     section: EmailSection,
 ) -> None:
     """Set the payload of a message part, re-encoding as needed."""
-    import base64
-    import quopri
-
     charset = section.charset or "utf-8"
 
     try:
@@ -161,14 +129,19 @@ def _set_part_payload(
 def _apply_replacements(content: str, annotations: list) -> str:
     """Replace annotated spans with [TAG] placeholders.
 
-    Processes from end to start to preserve earlier offsets.
+    Walks the annotations in start order, copying the untouched text between
+    them, and joins the pieces once. The cursor never moves backwards, so
+    text covered by overlapping annotations is never emitted.
     """
-    sorted_anns = sorted(annotations, key=lambda a: a.start_offset, reverse=True)
-    result = content
+    sorted_anns = sorted(annotations, key=lambda a: a.start_offset)
+    parts = []
+    cursor = 0
     for ann in sorted_anns:
-        tag = ann.tag or f"[{ann.class_name}]"
-        result = result[: ann.start_offset] + tag + result[ann.end_offset :]
-    return result
+        parts.append(content[cursor : ann.start_offset])
+        parts.append(ann.tag or f"[{ann.class_name}]")
+        cursor = max(cursor, ann.end_offset)
+    parts.append(content[cursor:])
+    return "".join(parts)
 
 
 def group_annotations_by_section(annotations) -> dict[int, list]:
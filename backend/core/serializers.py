@@ -1,9 +1,14 @@
 import re
 
+from django.db.models import Q
 from rest_framework import serializers
 
 from .models import AnnotationClass, ExcludedFileHash
 
+CLASS_NAME_RE = re.compile(r"^[a-z][a-z0-9_]*$")
+COLOR_RE = re.compile(r"^#[0-9a-fA-F]{6}$")
+SHA256_HEX_RE = re.compile(r"^[0-9a-f]{64}$")
+
 
 class MiniUserSerializer(serializers.Serializer):
     id = serializers.UUIDField()
@@ -34,29 +39,38 @@ class CreateAnnotationClassSerializer(serializers.Serializer):
     description = serializers.CharField(required=False, default="", allow_blank=True)
 
     def validate_name(self, value):
-        if not re.match(r"^[a-z][a-z0-9_]*$", value):
+        if not CLASS_NAME_RE.match(value):
             raise serializers.ValidationError(
                 "Name must start with a lowercase letter and contain only "
                 "lowercase letters, digits, and underscores."
             )
-        if AnnotationClass.objects.filter(name=value, is_deleted=False).exists():
-            raise serializers.ValidationError(
-                "An annotation class with this name already exists."
-            )
-        return value
-
-    def validate_display_label(self, value):
-        if AnnotationClass.objects.filter(display_label=value, is_deleted=False).exists():
-            raise serializers.ValidationError(
-                "An annotation class with this display label already exists."
-            )
         return value
 
     def validate_color(self, value):
-        if not re.match(r"^#[0-9a-fA-F]{6}$", value):
+        if not COLOR_RE.match(value):
             raise serializers.ValidationError("Color must be in #RRGGBB format.")
         return value
 
+    def validate(self, attrs):
+        # One query for both uniqueness checks, reported per field
+        name = attrs["name"]
+        display_label = attrs["display_label"]
+        errors = {}
+        for existing_name, existing_label in AnnotationClass.objects.filter(
+            Q(name=name) | Q(display_label=display_label), is_deleted=False
+        ).values_list("name", "display_label"):
+            if existing_name == name:
+                errors["name"] = [
+                    "An annotation class with this name already exists."
+                ]
+            if existing_label == display_label:
+                errors["display_label"] = [
+                    "An annotation class with this display label already exists."
+                ]
+        if errors:
+            raise serializers.ValidationError(errors)
+        return attrs
+
 
 class ExcludedFileHashSerializer(serializers.ModelSerializer):
     created_by = MiniUserSerializer(read_only=True)
@@ -81,7 +95,7 @@ class CreateExcludedFileHashSerializer(serializers.Serializer):
 
     def validate_content_hash(self, value):
         value = value.lower().strip()
-        if not re.match(r"^[0-9a-f]{64}$", value):
+        if not SHA256_HEX_RE.match(value):
             raise serializers.ValidationError(
                 "Must be a valid 64-character hex SHA-256 hash."
             )
@@ -93,7 +107,7 @@ class RenameAnnotationClassSerializer(serializers.Serializer):
     name = serializers.CharField(max_length=100)
 
     def validate_name(self, value):
-        if not re.match(r"^[a-z][a-z0-9_]*$", value):
+        if not CLASS_NAME_RE.match(value):
             raise serializers.ValidationError(
                 "Name must start with a lowercase letter and contain only "
                 "lowercase letters, digits, and underscores."
@@ -115,6 +129,6 @@ class UpdateAnnotationClassSerializer(serializers.Serializer):
     description = serializers.CharField(required=False, allow_blank=True)
 
     def validate_color(self, value):
-        if not re.match(r"^#[0-9a-fA-F]{6}$", value):
+        if not COLOR_RE.match(value):
             raise serializers.ValidationError("Color must be in #RRGGBB format.")
         return value
@@ -1,54 +1,156 @@
 import json
 
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
 from rest_framework import status as http_status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from core.permissions import IsAdmin
+from core.permissions import IsAdmin, IsAdminOrReadOnly
 
 from .models import PlatformSetting
 
 
-DEFAULT_DISCARD_REASONS = [
+SETTING_CACHE_TIMEOUT = 60  # seconds
+
+# DATA_UPLOAD_MAX_MEMORY_SIZE is sized for dataset uploads; the discard
+# reasons PUT is a small JSON body and gets its own limits.
+MAX_DISCARD_REASONS_BODY_SIZE = 64 * 1024  # bytes
+MAX_DISCARD_REASONS = 256
+MAX_DISCARD_REASON_LENGTH = 200
+
+DEFAULT_DISCARD_REASONS = (
     "Not an email",
     "Corrupted file",
     "Duplicate content",
     "Irrelevant content",
     "Incomplete/truncated",
     "Other",
-]
+)
 
 
-def get_discard_reasons():
-    """Return list of configured discard reasons."""
+def setting_cache_key(key):
+    """Cache key for a PlatformSetting value (invalidated by core.signals)."""
+    return f"platform_setting:{key}"
+
+
+def shared_setting_cache():
+    """Return the default cache if it is shared between workers, else None.
+
+    Settings enforce policy, so a per-process LocMemCache must not serve them:
+    a save only invalidates the worker that handled it, and the other workers
+    would keep applying the old value until the entry expires.
+    """
+    backend = caches["default"]
+    if isinstance(backend, LocMemCache):
+        return None
+    return backend
+
+
+_TRUE_VALUES = frozenset(("true", "1", "yes"))
+
+
+def _parse_blind_review(value):
+    return value is not None and value.lower() in _TRUE_VALUES
+
+
+def _parse_min_annotation_length(value):
     try:
-        setting = PlatformSetting.objects.get(key="discard_reasons")
-        reasons = json.loads(setting.value)
+        return max(1, int(value))
+    except (TypeError, ValueError):
+        return 1
+
+
+def _parse_discard_reasons(value):
+    if value is not None:
+        try:
+            reasons = json.loads(value)
+        except json.JSONDecodeError:
+            reasons = None
         if isinstance(reasons, list) and len(reasons) > 0:
             return reasons
-    except (PlatformSetting.DoesNotExist, json.JSONDecodeError):
-        pass
-    return DEFAULT_DISCARD_REASONS
+    # A fresh list, so callers can never mutate the shared defaults
+    return list(DEFAULT_DISCARD_REASONS)
+
+
+SETTING_PARSERS = {
+    "blind_review": _parse_blind_review,
+    "min_annotation_length": _parse_min_annotation_length,
+    "discard_reasons": _parse_discard_reasons,
+}
+
+
+def save_setting(key, value):
+    """Upsert a PlatformSetting value and drop its cached copy."""
+    PlatformSetting.objects.bulk_create(
+        [PlatformSetting(key=key, value=value)],
+        update_conflicts=True,
+        unique_fields=["key"],
+        update_fields=["value"],
+    )
+    # bulk_create bypasses the post_save handler in core.signals
+    cache.delete(setting_cache_key(key))
+
+
+def get_settings(keys=tuple(SETTING_PARSERS)):
+    """Return parsed values for several settings, loading misses in one query.
+
+    Values are cached only when the cache is shared between workers.
+    """
+    shared_cache = shared_setting_cache()
+    values = {}
+    if shared_cache is not None:
+        cache_keys = {setting_cache_key(key): key for key in keys}
+        values = {
+            cache_keys[cache_key]: value
+            for cache_key, value in shared_cache.get_many(cache_keys).items()
+        }
+    missing = [key for key in keys if key not in values]
+    if missing:
+        rows = dict(
+            PlatformSetting.objects.filter(key__in=missing).values_list("key", "value")
+        )
+        loaded = {key: SETTING_PARSERS[key](rows.get(key)) for key in missing}
+        if shared_cache is not None:
+            shared_cache.set_many(
+                {setting_cache_key(key): value for key, value in loaded.items()},
+                SETTING_CACHE_TIMEOUT,
+            )
+        values.update(loaded)
+    return values
+
+
+def get_blind_review_enabled():
+    """Return whether blind review is enabled for QA."""
+    return get_settings(("blind_review",))["blind_review"]
+
+
+def get_min_annotation_length():
+    """Return the configured minimum annotation length (at least 1)."""
+    return get_settings(("min_annotation_length",))["min_annotation_length"]
+
+
+def get_discard_reasons():
+    """Return list of configured discard reasons."""
+    return get_settings(("discard_reasons",))["discard_reasons"]
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated, IsAdmin])
+def all_settings(request):
+    return Response(get_settings())
 
 
 @api_view(["GET", "PUT"])
 @permission_classes([IsAuthenticated, IsAdmin])
 def blind_review_setting(request):
     if request.method == "GET":
-        try:
-            setting = PlatformSetting.objects.get(key="blind_review")
-            enabled = setting.value.lower() in ("true", "1", "yes")
-        except PlatformSetting.DoesNotExist:
-            enabled = False
-        return Response({"enabled": enabled})
+        return Response({"enabled": get_blind_review_enabled()})
 
     # PUT
     enabled = request.data.get("enabled", False)
-    PlatformSetting.objects.update_or_create(
-        key="blind_review",
-        defaults={"value": str(enabled).lower()},
-    )
+    save_setting("blind_review", str(enabled).lower())
     return Response({"enabled": bool(enabled)})
 
 
@@ -56,36 +158,32 @@ def blind_review_setting(request):
 @permission_classes([IsAuthenticated, IsAdmin])
 def min_annotation_length_setting(request):
     if request.method == "GET":
-        try:
-            setting = PlatformSetting.objects.get(key="min_annotation_length")
-            min_length = max(1, int(setting.value))
-        except (PlatformSetting.DoesNotExist, ValueError):
-            min_length = 1
-        return Response({"min_length": min_length})
+        return Response({"min_length": get_min_annotation_length()})
 
     # PUT
     try:
         min_length = max(1, int(request.data.get("min_length", 1)))
     except (TypeError, ValueError):
         min_length = 1
-    PlatformSetting.objects.update_or_create(
-        key="min_annotation_length",
-        defaults={"value": str(min_length)},
-    )
+    save_setting("min_annotation_length", str(min_length))
     return Response({"min_length": min_length})
 
 
 @api_view(["GET", "PUT"])
-@permission_classes([IsAuthenticated])
+@permission_classes([IsAuthenticated, IsAdminOrReadOnly])
 def discard_reasons_setting(request):
     if request.method == "GET":
         return Response({"reasons": get_discard_reasons()})
 
-    # PUT — admin only
-    if not IsAdmin().has_permission(request, None):
+    # PUT — reject oversized bodies before request.data parses them
+    try:
+        content_length = int(request.META.get("CONTENT_LENGTH") or 0)
+    except ValueError:
+        content_length = 0
+    if content_length > MAX_DISCARD_REASONS_BODY_SIZE:
         return Response(
-            {"detail": "You do not have permission to perform this action."},
-            status=http_status.HTTP_403_FORBIDDEN,
+            {"detail": "Request body is too large."},
+            status=http_status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
         )
     reasons = request.data.get("reasons")
     if not isinstance(reasons, list) or len(reasons) == 0:
@@ -93,15 +191,26 @@ def discard_reasons_setting(request):
             {"detail": "reasons must be a non-empty list of strings."},
             status=http_status.HTTP_400_BAD_REQUEST,
         )
+    if len(reasons) > MAX_DISCARD_REASONS:
+        return Response(
+            {"reasons": [f"Ensure this list has at most {MAX_DISCARD_REASONS} items."]},
+            status=http_status.HTTP_400_BAD_REQUEST,
+        )
     # Validate all items are non-empty strings
-    cleaned = [r.strip() for r in reasons if isinstance(r, str) and r.strip()]
+    cleaned = [s for r in reasons if isinstance(r, str) and (s := r.strip())]
     if len(cleaned) == 0:
         return Response(
             {"detail": "reasons must contain at least one non-empty string."},
             status=http_status.HTTP_400_BAD_REQUEST,
         )
-    PlatformSetting.objects.update_or_create(
-        key="discard_reasons",
-        defaults={"value": json.dumps(cleaned)},
-    )
+    if any(len(r) > MAX_DISCARD_REASON_LENGTH for r in cleaned):
+        return Response(
+            {
+                "reasons": [
+                    f"Ensure each reason has at most {MAX_DISCARD_REASON_LENGTH} characters."
+                ]
+            },
+            status=http_status.HTTP_400_BAD_REQUEST,
+        )
+    save_setting("discard_reasons", json.dumps(cleaned))
     return Response({"reasons": cleaned})
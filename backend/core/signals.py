@@ -0,0 +1,11 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import PlatformSetting
+from .settings_views import setting_cache_key
+
+
+@receiver([post_save, post_delete], sender=PlatformSetting)
+def invalidate_platform_setting_cache(sender, instance, **kwargs):
+    cache.delete(setting_cache_key(instance.key))
@@ -194,6 +194,24 @@ class TestExtractSectionsMultipart(SimpleTestCase):
         self.assertEqual(sections[1].content, "Caf\xe9 au lait")
         self.assertEqual(sections[1].charset, "iso-8859-1")
 
+    def test_utf16_crlf_body(self):
+        import base64
+        # \r is two bytes in UTF-16 and U+010D encodes with a 0x0D byte, so
+        # \r must be stripped after decoding, not from the raw bytes
+        body = "\u010cau \u010dlov\u011bk\r\nLine 2\r\n"
+        encoded = base64.b64encode(body.encode("utf-16")).decode("ascii")
+        raw = (
+            "From: sender@test.com\r\n"
+            "Content-Type: text/plain; charset=utf-16\r\n"
+            "Content-Transfer-Encoding: base64\r\n"
+            "\r\n"
+            f"{encoded}\r\n"
+        )
+        sections = extract_sections(raw)
+        self.assertEqual(sections[1].content, "\u010cau \u010dlov\u011bk\nLine 2\n")
+        self.assertNotIn("\r", sections[1].content)
+        self.assertEqual(sections[1].charset, "utf-16")
+
 
 class TestExtractSectionsEdgeCases(SimpleTestCase):
     """Test edge cases and the specific DoorDash HTML comment bug."""
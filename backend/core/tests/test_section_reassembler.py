@@ -2,30 +2,59 @@
 
 import base64
 import email
+import re
+from dataclasses import dataclass
 
 from django.test import SimpleTestCase
 
-from core.section_extractor import extract_sections
+from core.section_extractor import extract_sections, extract_sections_and_message
 from core.section_reassembler import (
     deidentify_and_reassemble,
     group_annotations_by_section,
 )
 
+_HEADER_SEP = re.compile(r"\r?\n\r?\n")
 
+
+@dataclass(frozen=True, slots=True)
 class FakeAnnotation:
     """Minimal annotation-like object for testing."""
 
-    def __init__(self, section_index, start_offset, end_offset, tag, class_name=""):
-        self.section_index = section_index
-        self.start_offset = start_offset
-        self.end_offset = end_offset
-        self.tag = tag
-        self.class_name = class_name
+    section_index: int
+    start_offset: int
+    end_offset: int
+    tag: str
+    class_name: str = ""
+
+
+def _annotate(section_index, content, tags):
+    """Annotate every occurrence of each target in one regex pass.
+
+    tags maps target text to its replacement tag.
+    """
+    pattern = re.compile("|".join(map(re.escape, tags)))
+    return [
+        FakeAnnotation(section_index, m.start(), m.end(), tags[m.group()])
+        for m in pattern.finditer(content)
+    ]
+
+
+def _locate(content, needle, nth=0):
+    """Return the start offset of the nth (0-based) occurrence of needle."""
+    start = -1
+    for _ in range(nth + 1):
+        start = content.find(needle, start + 1)
+        if start == -1:
+            raise AssertionError(f"occurrence {nth} of {needle!r} not found")
+    return start
 
 
 class TestDeidentifyAndReassemble(SimpleTestCase):
     """Test round-trip deidentification + reassembly."""
 
+    _SSN_BODY = "My SSN is 123-45-6789"
+    _SSN_B64 = base64.b64encode(_SSN_BODY.encode("utf-8")).decode("ascii")
+
     def _assert_parsable(self, result, expect_multipart=False):
         """Assert the result is a valid parsable .eml string.
 
@@ -48,6 +77,13 @@ class TestDeidentifyAndReassemble(SimpleTestCase):
             self.assertIsNotNone(body, "Single-part body should be decodable")
         return msg
 
+    def _assert_none_present(self, text, tokens):
+        """Assert none of tokens occurs in text, scanning it once."""
+        match = re.compile("|".join(map(re.escape, tokens))).search(text)
+        self.assertIsNone(
+            match, f"{match and match.group()!r} still present in output"
+        )
+
     def test_single_part_plain_text(self):
         raw = (
             "From: alice@example.com\r\n"
@@ -64,7 +100,8 @@ class TestDeidentifyAndReassemble(SimpleTestCase):
         result = deidentify_and_reassemble(raw, sections, anns_by_section)
         # The email address in the body should be replaced
         self.assertIn("[email_1]", result)
-        self.assertNotIn("alice@example.com\r\n", result.split("\r\n\r\n", 1)[-1] if "\r\n\r\n" in result else result.split("\n\n", 1)[-1])
+        body = _HEADER_SEP.split(result, maxsplit=1)[-1]
+        self.assertNotIn("alice@example.com", body)
 
     def test_multipart_alternative(self):
         raw = (
@@ -96,14 +133,12 @@ class TestDeidentifyAndReassemble(SimpleTestCase):
         self.assertTrue(msg.is_multipart())
 
     def test_base64_re_encoding(self):
-        body = "My SSN is 123-45-6789"
-        encoded = base64.b64encode(body.encode("utf-8")).decode("ascii")
         raw = (
             "From: sender@test.com\r\n"
             "Content-Type: text/plain; charset=utf-8\r\n"
             "Content-Transfer-Encoding: base64\r\n"
             "\r\n"
-            f"{encoded}\r\n"
+            f"{self._SSN_B64}\r\n"
         )
         sections = extract_sections(raw)
         anns = [FakeAnnotation(1, 10, 21, "[ssn_1]")]  # "123-45-6789"
@@ -115,9 +150,9 @@ class TestDeidentifyAndReassemble(SimpleTestCase):
         cte = msg.get("Content-Transfer-Encoding", "").lower()
         self.assertEqual(cte, "base64")
         # Decode and verify replacement
-        decoded = msg.get_payload(decode=True).decode("utf-8", errors="replace")
-        self.assertIn("[ssn_1]", decoded)
-        self.assertNotIn("123-45-6789", decoded)
+        payload = msg.get_payload(decode=True)
+        self.assertIn(b"[ssn_1]", payload)
+        self.assertNotIn(b"123-45-6789", payload)
 
     def test_no_annotations(self):
         raw = (
@@ -133,49 +168,167 @@ class TestDeidentifyAndReassemble(SimpleTestCase):
         body = msg.get_payload(decode=True)
         self.assertIsNotNone(body)
 
-    def test_header_deidentification(self):
+    def test_unannotated_part_keeps_original_payload(self):
         raw = (
-            "From: alice@example.com\r\n"
-            "To: bob@example.com\r\n"
-            "Subject: Hello\r\n"
+            "From: sender@test.com\r\n"
+            "Content-Type: multipart/alternative; boundary=abc123\r\n"
+            "\r\n"
+            "--abc123\r\n"
             "Content-Type: text/plain; charset=utf-8\r\n"
             "\r\n"
-            "Body text\r\n"
+            "Call me at 555-1234\r\n"
+            "--abc123\r\n"
+            "Content-Type: text/html; charset=utf-8\r\n"
+            "Content-Transfer-Encoding: quoted-printable\r\n"
+            "\r\n"
+            "<p style=3D\"x\">No PII in this=\r\n"
+            " part</p>\r\n"
+            "--abc123--\r\n"
         )
         sections = extract_sections(raw)
-        # Annotate "alice@example.com" in headers (section 0)
-        header_content = sections[0].content
-        start = header_content.find("alice@example.com")
-        end = start + len("alice@example.com")
-        anns = [FakeAnnotation(0, start, end, "[email_1]")]
-        anns_by_section = group_annotations_by_section(anns)
+        anns = [FakeAnnotation(1, 11, 19, "[phone_1]")]
+        result = deidentify_and_reassemble(
+            raw, sections, group_annotations_by_section(anns)
+        )
 
-        result = deidentify_and_reassemble(raw, sections, anns_by_section)
-        self.assertIn("[email_1]", result)
-        self.assertNotIn("alice@example.com", result)
+        msg = self._assert_parsable(result, expect_multipart=True)
+        plain, html = msg.get_payload()
+        self.assertIn("[phone_1]", plain.get_payload())
+        self.assertEqual(html["Content-Transfer-Encoding"], "quoted-printable")
+        # Soft line break survives: the part was not decoded and re-encoded
+        self.assertEqual(
+            html.get_payload(), '<p style=3D"x">No PII in this=\n part</p>'
+        )
 
-    def test_header_continuation_line(self):
-        """PII on a continuation line (indented) in a multi-line header."""
-        raw = (
+    # (name, raw, target, tag, check_parsable): one header annotation each
+    _HEADER_VARIANTS = [
+        (
+            "simple_from_header",
+            "From: alice@example.com\r\n"
+            "To: bob@example.com\r\n"
+            "Subject: Hello\r\n"
+            "Content-Type: text/plain; charset=utf-8\r\n"
+            "\r\n"
+            "Body text\r\n",
+            "alice@example.com",
+            "[email_1]",
+            False,
+        ),
+        (
+            # PII on a continuation line (indented) in a multi-line header
+            "continuation_line",
             "Received: from mail.example.com\r\n"
             "\tby mx.google.com\r\n"
             "\tfor <danielle@gmail.com>;\r\n"
             "\tMon, 1 Jan 2024 00:00:00 +0000\r\n"
             "Content-Type: text/plain; charset=utf-8\r\n"
             "\r\n"
+            "Body text\r\n",
+            "danielle@gmail.com",
+            "[email_1]",
+            False,
+        ),
+        (
+            # PII buried in a multi-line header continuation
+            "multiline_value",
+            "ARC-Authentication-Results: i=1; mx.google.com;\r\n"
+            "       dkim=pass header.i=@example.com header.s=sel1\r\n"
+            "       header.b=AbCdEfGh;\r\n"
+            "       spf=pass (google.com: domain of admin@company.org)\r\n"
+            "Content-Type: text/plain; charset=utf-8\r\n"
+            "\r\n"
+            "Body text\r\n",
+            "admin@company.org",
+            "[email_1]",
+            False,
+        ),
+        (
+            # Headers with LF-only line endings
+            "lf_only_line_endings",
+            "From: alice@example.com\n"
+            "To: bob@example.com\n"
+            "Content-Type: text/plain; charset=utf-8\n"
+            "\n"
+            "Body text\n",
+            "alice@example.com",
+            "[email_1]",
+            False,
+        ),
+        (
+            # Continuation line using spaces (not tabs)
+            "space_indented_continuation",
+            "ARC-Authentication-Results: i=1; mx.google.com;\r\n"
+            "       dkim=pass header.i=@example.com header.s=sel1\r\n"
+            "       spf=pass (google.com: domain of admin@company.org)\r\n"
+            "From: sender@example.com\r\n"
+            "Content-Type: text/plain; charset=utf-8\r\n"
+            "\r\n"
+            "Body text\r\n",
+            "admin@company.org",
+            "[email_1]",
+            True,
+        ),
+        (
+            # Header value near RFC 998 char limit
+            "very_long_single_line_header",
+            "From: sender@example.com\r\n"
+            f"X-Google-Smtp-Source: {'x' * 80}SENSITIVE_TOKEN_12345{'y' * 80}\r\n"
+            "Content-Type: text/plain; charset=utf-8\r\n"
+            "\r\n"
+            "Body text\r\n",
+            "SENSITIVE_TOKEN_12345",
+            "[token_1]",
+            True,
+        ),
+        (
+            # Headers only, no blank line separator, no body
+            "header_only_no_body",
+            "From: alice@example.com\r\n"
+            "To: bob@example.com\r\n"
+            "Subject: Headers only\r\n",
+            "alice@example.com",
+            "[email_1]",
+            False,
+        ),
+    ]
+
+    def test_header_variants(self):
+        """A single header annotation is replaced across header layouts."""
+        for name, raw, target, tag, check_parsable in self._HEADER_VARIANTS:
+            with self.subTest(name=name):
+                sections = extract_sections(raw)
+                start = sections[0].content.find(target)
+                self.assertNotEqual(start, -1, f"{target!r} not in headers")
+                anns = [FakeAnnotation(0, start, start + len(target), tag)]
+                result = deidentify_and_reassemble(
+                    raw, sections, group_annotations_by_section(anns)
+                )
+                self.assertIn(tag, result)
+                self.assertNotIn(target, result)
+                if check_parsable:
+                    self._assert_parsable(result)
+
+    def test_annotation_on_continuation_line_content(self):
+        """Annotation on content within a continuation line (preserves leading whitespace)."""
+        raw = (
+            "Received: from server.com\r\n"
+            "\tfor <alice@test.com>\r\n"
+            "From: sender@example.com\r\n"
+            "Content-Type: text/plain; charset=utf-8\r\n"
+            "\r\n"
             "Body text\r\n"
         )
         sections = extract_sections(raw)
-        header_content = sections[0].content
-        target = "danielle@gmail.com"
-        start = header_content.find(target)
+        hc = sections[0].content
+        # Select "for <alice@test.com>" without the leading tab
+        target = "for <alice@test.com>"
+        start = hc.find(target)
         end = start + len(target)
-        anns = [FakeAnnotation(0, start, end, "[email_1]")]
-        anns_by_section = group_annotations_by_section(anns)
-
-        result = deidentify_and_reassemble(raw, sections, anns_by_section)
-        self.assertIn("[email_1]", result)
-        self.assertNotIn("danielle@gmail.com", result)
+        anns = [FakeAnnotation(0, start, end, "[redacted_1]")]
+        result = deidentify_and_reassemble(raw, sections, group_annotations_by_section(anns))
+        self.assertIn("[redacted_1]", result)
+        self.assertNotIn("alice@test.com", result)
+        self._assert_parsable(result)
 
     def test_header_duplicate_headers(self):
         """PII in duplicate headers (e.g. multiple Received: headers)."""
@@ -189,42 +342,15 @@ class TestDeidentifyAndReassemble(SimpleTestCase):
         sections = extract_sections(raw)
         header_content = sections[0].content
         # Annotate both emails
-        alice_start = header_content.find("alice@test.com")
-        bob_start = header_content.find("bob@test.com")
-        anns = [
-            FakeAnnotation(0, alice_start, alice_start + len("alice@test.com"), "[email_1]"),
-            FakeAnnotation(0, bob_start, bob_start + len("bob@test.com"), "[email_2]"),
-        ]
-        anns_by_section = group_annotations_by_section(anns)
-
-        result = deidentify_and_reassemble(raw, sections, anns_by_section)
-        self.assertIn("[email_1]", result)
-        self.assertIn("[email_2]", result)
-        self.assertNotIn("alice@test.com", result)
-        self.assertNotIn("bob@test.com", result)
-
-    def test_header_multiline_value(self):
-        """PII buried in a multi-line header continuation."""
-        raw = (
-            "ARC-Authentication-Results: i=1; mx.google.com;\r\n"
-            "       dkim=pass header.i=@example.com header.s=sel1\r\n"
-            "       header.b=AbCdEfGh;\r\n"
-            "       spf=pass (google.com: domain of admin@company.org)\r\n"
-            "Content-Type: text/plain; charset=utf-8\r\n"
-            "\r\n"
-            "Body text\r\n"
+        anns = _annotate(
+            0, header_content, {"alice@test.com": "[email_1]", "bob@test.com": "[email_2]"}
         )
-        sections = extract_sections(raw)
-        header_content = sections[0].content
-        target = "admin@company.org"
-        start = header_content.find(target)
-        end = start + len(target)
-        anns = [FakeAnnotation(0, start, end, "[email_1]")]
         anns_by_section = group_annotations_by_section(anns)
 
         result = deidentify_and_reassemble(raw, sections, anns_by_section)
         self.assertIn("[email_1]", result)
-        self.assertNotIn("admin@company.org", result)
+        self.assertIn("[email_2]", result)
+        self._assert_none_present(result, ["alice@test.com", "bob@test.com"])
 
     def test_header_and_body_combined(self):
         """Annotations in both headers and body are replaced."""
@@ -240,14 +366,9 @@ class TestDeidentifyAndReassemble(SimpleTestCase):
         header_content = sections[0].content
         body_content = sections[1].content
 
-        h_start = header_content.find("alice@example.com")
-        b_email_start = body_content.find("alice@example.com")
-        b_phone_start = body_content.find("555-0100")
-
         anns = [
-            FakeAnnotation(0, h_start, h_start + len("alice@example.com"), "[email_1]"),
-            FakeAnnotation(1, b_email_start, b_email_start + len("alice@example.com"), "[email_2]"),
-            FakeAnnotation(1, b_phone_start, b_phone_start + len("555-0100"), "[phone_1]"),
+            *_annotate(0, header_content, {"alice@example.com": "[email_1]"}),
+            *_annotate(1, body_content, {"alice@example.com": "[email_2]", "555-0100": "[phone_1]"}),
         ]
         anns_by_section = group_annotations_by_section(anns)
 
@@ -257,26 +378,6 @@ class TestDeidentifyAndReassemble(SimpleTestCase):
         self.assertIn("[phone_1]", result)
         self.assertNotIn("555-0100", result)
 
-    def test_header_lf_only_line_endings(self):
-        """Headers with LF-only line endings are handled correctly."""
-        raw = (
-            "From: alice@example.com\n"
-            "To: bob@example.com\n"
-            "Content-Type: text/plain; charset=utf-8\n"
-            "\n"
-            "Body text\n"
-        )
-        sections = extract_sections(raw)
-        header_content = sections[0].content
-        start = header_content.find("alice@example.com")
-        end = start + len("alice@example.com")
-        anns = [FakeAnnotation(0, start, end, "[email_1]")]
-        anns_by_section = group_annotations_by_section(anns)
-
-        result = deidentify_and_reassemble(raw, sections, anns_by_section)
-        self.assertIn("[email_1]", result)
-        self.assertNotIn("alice@example.com", result)
-
     def test_cte_header_position_preserved(self):
         """CTE header should stay in its original position, not move to the end."""
         raw = (
@@ -285,10 +386,8 @@ class TestDeidentifyAndReassemble(SimpleTestCase):
             "Content-Transfer-Encoding: base64\r\n"
             "X-Custom: value\r\n"
             "\r\n"
+            f"{self._SSN_B64}\r\n"
         )
-        body = "My SSN is 123-45-6789"
-        encoded = base64.b64encode(body.encode("utf-8")).decode("ascii")
-        raw += encoded + "\r\n"
 
         sections = extract_sections(raw)
         anns = [FakeAnnotation(1, 10, 21, "[ssn_1]")]
@@ -297,15 +396,21 @@ class TestDeidentifyAndReassemble(SimpleTestCase):
         result = deidentify_and_reassemble(raw, sections, anns_by_section)
 
         # Extract header names in order from the result
-        header_block = result.split("\n\n")[0]
+        header_block, _, _ = result.partition("\n\n")
         header_names = []
-        for line in header_block.split("\n"):
+        cte_idx = custom_idx = None
+        for line in header_block.splitlines():
             if ":" in line and not line.startswith((" ", "\t")):
-                header_names.append(line.split(":", 1)[0])
+                name = line.split(":", 1)[0]
+                if name == "Content-Transfer-Encoding":
+                    cte_idx = len(header_names)
+                elif name == "X-Custom":
+                    custom_idx = len(header_names)
+                header_names.append(name)
 
         # CTE should come before X-Custom, not after it
-        cte_idx = header_names.index("Content-Transfer-Encoding")
-        custom_idx = header_names.index("X-Custom")
+        self.assertIsNotNone(cte_idx, f"CTE header missing. Header order: {header_names}")
+        self.assertIsNotNone(custom_idx, f"X-Custom header missing. Header order: {header_names}")
         self.assertLess(
             cte_idx,
             custom_idx,
@@ -330,61 +435,11 @@ class TestDeidentifyAndReassemble(SimpleTestCase):
         )
         sections = extract_sections(raw)
         hc = sections[0].content
-        alice_start = hc.find("alice@test.com")
-        bob_start = hc.find("bob@test.com")
-        anns = [
-            FakeAnnotation(0, alice_start, alice_start + len("alice@test.com"), "[email_1]"),
-            FakeAnnotation(0, bob_start, bob_start + len("bob@test.com"), "[email_2]"),
-        ]
+        anns = _annotate(0, hc, {"alice@test.com": "[email_1]", "bob@test.com": "[email_2]"})
         result = deidentify_and_reassemble(raw, sections, group_annotations_by_section(anns))
         self.assertIn("[email_1]", result)
         self.assertIn("[email_2]", result)
-        self.assertNotIn("alice@test.com", result)
-        self.assertNotIn("bob@test.com", result)
-        self._assert_parsable(result)
-
-    def test_annotation_on_continuation_line_content(self):
-        """Annotation on content within a continuation line (preserves leading whitespace)."""
-        raw = (
-            "Received: from server.com\r\n"
-            "\tfor <alice@test.com>\r\n"
-            "From: sender@example.com\r\n"
-            "Content-Type: text/plain; charset=utf-8\r\n"
-            "\r\n"
-            "Body text\r\n"
-        )
-        sections = extract_sections(raw)
-        hc = sections[0].content
-        # Select "for <alice@test.com>" without the leading tab
-        target = "for <alice@test.com>"
-        start = hc.find(target)
-        end = start + len(target)
-        anns = [FakeAnnotation(0, start, end, "[redacted_1]")]
-        result = deidentify_and_reassemble(raw, sections, group_annotations_by_section(anns))
-        self.assertIn("[redacted_1]", result)
-        self.assertNotIn("alice@test.com", result)
-        self._assert_parsable(result)
-
-    def test_space_indented_continuation(self):
-        """Continuation line using spaces (not tabs)."""
-        raw = (
-            "ARC-Authentication-Results: i=1; mx.google.com;\r\n"
-            "       dkim=pass header.i=@example.com header.s=sel1\r\n"
-            "       spf=pass (google.com: domain of admin@company.org)\r\n"
-            "From: sender@example.com\r\n"
-            "Content-Type: text/plain; charset=utf-8\r\n"
-            "\r\n"
-            "Body text\r\n"
-        )
-        sections = extract_sections(raw)
-        hc = sections[0].content
-        target = "admin@company.org"
-        start = hc.find(target)
-        end = start + len(target)
-        anns = [FakeAnnotation(0, start, end, "[email_1]")]
-        result = deidentify_and_reassemble(raw, sections, group_annotations_by_section(anns))
-        self.assertIn("[email_1]", result)
-        self.assertNotIn("admin@company.org", result)
+        self._assert_none_present(result, ["alice@test.com", "bob@test.com"])
         self._assert_parsable(result)
 
     def test_multiple_annotations_across_three_received_headers(self):
@@ -400,16 +455,12 @@ class TestDeidentifyAndReassemble(SimpleTestCase):
         )
         sections = extract_sections(raw)
         hc = sections[0].content
-        anns = []
-        for i, addr in enumerate(["user1@test.com", "user2@test.com", "user3@test.com"], 1):
-            start = hc.find(addr)
-            anns.append(FakeAnnotation(0, start, start + len(addr), f"[email_{i}]"))
+        anns = _annotate(0, hc, {f"user{i}@test.com": f"[email_{i}]" for i in range(1, 4)})
+        self.assertEqual(len(anns), 3)
         result = deidentify_and_reassemble(raw, sections, group_annotations_by_section(anns))
         for i in range(1, 4):
             self.assertIn(f"[email_{i}]", result)
-        self.assertNotIn("user1@test.com", result)
-        self.assertNotIn("user2@test.com", result)
-        self.assertNotIn("user3@test.com", result)
+        self._assert_none_present(result, ["user1@test.com", "user2@test.com", "user3@test.com"])
         self._assert_parsable(result)
 
     def test_class_name_fallback_for_header_annotation(self):
@@ -452,25 +503,30 @@ class TestDeidentifyAndReassemble(SimpleTestCase):
         result = deidentify_and_reassemble(raw, sections, group_annotations_by_section(anns))
         self.assertIn("[email_1]", result)
         self.assertIn("[email_2]", result)
-        self.assertNotIn("alice@test.com", result)
-        self.assertNotIn("bob@test.com", result)
+        self._assert_none_present(result, ["alice@test.com", "bob@test.com"])
         self._assert_parsable(result)
 
-    def test_header_only_email_no_body(self):
-        """Email with headers only, no blank line separator, no body."""
+    def test_overlapping_annotations_leak_nothing(self):
+        """Nested and partially overlapping spans never re-emit covered text."""
         raw = (
-            "From: alice@example.com\r\n"
-            "To: bob@example.com\r\n"
-            "Subject: Headers only\r\n"
+            "From: sender@example.com\r\n"
+            "Content-Type: text/plain; charset=utf-8\r\n"
+            "\r\n"
+            "Contact John Smith at 555-1234 today\r\n"
         )
         sections = extract_sections(raw)
-        hc = sections[0].content
-        start = hc.find("alice@example.com")
-        end = start + len("alice@example.com")
-        anns = [FakeAnnotation(0, start, end, "[email_1]")]
+        body = sections[1].content
+        name_start = body.find("John Smith")
+        phone_end = body.find("555-1234") + len("555-1234")
+        anns = [
+            FakeAnnotation(1, name_start, phone_end, "[contact_1]"),
+            FakeAnnotation(1, name_start + 5, name_start + 10, "[name_1]"),
+            FakeAnnotation(1, phone_end - 4, phone_end + 6, "[misc_1]"),
+        ]
         result = deidentify_and_reassemble(raw, sections, group_annotations_by_section(anns))
-        self.assertIn("[email_1]", result)
-        self.assertNotIn("alice@example.com", result)
+        msg = self._assert_parsable(result)
+        decoded = msg.get_payload(decode=True).decode("utf-8")
+        self.assertEqual(decoded, "Contact [contact_1][name_1][misc_1]\n")
 
     def test_multipart_with_header_annotations_preserves_structure(self):
         """Header annotation on multipart email must not corrupt boundary."""
@@ -529,27 +585,6 @@ class TestDeidentifyAndReassemble(SimpleTestCase):
         self.assertIn("John Q. Doe", result)
         self._assert_parsable(result)
 
-    def test_very_long_single_line_header(self):
-        """Header value near RFC 998 char limit."""
-        long_value = "x" * 80 + "SENSITIVE_TOKEN_12345" + "y" * 80
-        raw = (
-            "From: sender@example.com\r\n"
-            f"X-Google-Smtp-Source: {long_value}\r\n"
-            "Content-Type: text/plain; charset=utf-8\r\n"
-            "\r\n"
-            "Body text\r\n"
-        )
-        sections = extract_sections(raw)
-        hc = sections[0].content
-        target = "SENSITIVE_TOKEN_12345"
-        start = hc.find(target)
-        end = start + len(target)
-        anns = [FakeAnnotation(0, start, end, "[token_1]")]
-        result = deidentify_and_reassemble(raw, sections, group_annotations_by_section(anns))
-        self.assertIn("[token_1]", result)
-        self.assertNotIn("SENSITIVE_TOKEN_12345", result)
-        self._assert_parsable(result)
-
     def test_multiple_pii_types_in_headers(self):
         """Email, name, and IP address annotated across the header block."""
         raw = (
@@ -564,21 +599,17 @@ class TestDeidentifyAndReassemble(SimpleTestCase):
         )
         sections = extract_sections(raw)
         hc = sections[0].content
-        ip_target = "10.0.0.42"
-        email_target = "alice@test.com"
-        name_target = "John Smith"
-        anns = [
-            FakeAnnotation(0, hc.find(ip_target), hc.find(ip_target) + len(ip_target), "[ip_1]"),
-            FakeAnnotation(0, hc.find(email_target), hc.find(email_target) + len(email_target), "[email_1]"),
-            FakeAnnotation(0, hc.find(name_target), hc.find(name_target) + len(name_target), "[name_1]"),
-        ]
+        anns = _annotate(
+            0,
+            hc,
+            {"10.0.0.42": "[ip_1]", "alice@test.com": "[email_1]", "John Smith": "[name_1]"},
+        )
+        self.assertEqual(len(anns), 3)
         result = deidentify_and_reassemble(raw, sections, group_annotations_by_section(anns))
         self.assertIn("[ip_1]", result)
         self.assertIn("[email_1]", result)
         self.assertIn("[name_1]", result)
-        self.assertNotIn("10.0.0.42", result)
-        self.assertNotIn("alice@test.com", result)
-        self.assertNotIn("John Smith", result)
+        self._assert_none_present(result, ["10.0.0.42", "alice@test.com", "John Smith"])
         self._assert_parsable(result)
 
     def test_empty_annotation_list_for_header_section(self):
@@ -592,10 +623,8 @@ class TestDeidentifyAndReassemble(SimpleTestCase):
         sections = extract_sections(raw)
         # Manually create {0: []} — empty list for header section
         result = deidentify_and_reassemble(raw, sections, {0: []})
-        # Headers should be unchanged
-        self.assertIn("alice@example.com", result)
-        msg = email.message_from_string(result)
-        self.assertEqual(msg["From"], "alice@example.com")
+        # Nothing changes beyond the serializer's \n line endings
+        self.assertEqual(result, raw.replace("\r\n", "\n"))
 
     def test_header_annotation_result_parses_correctly(self):
         """After header deidentification, key headers remain accessible via email API."""
@@ -624,12 +653,13 @@ class TestDeidentifyAndReassemble(SimpleTestCase):
     def test_body_content_survives_header_splice(self):
         """After header-only annotations, body payload decoded matches original exactly."""
         body_text = "This is the original body content.\nWith multiple lines.\n"
+        crlf_body = body_text.replace("\n", "\r\n")
         raw = (
             "From: alice@example.com\r\n"
             "To: bob@example.com\r\n"
             "Content-Type: text/plain; charset=utf-8\r\n"
             "\r\n"
-            + body_text.replace("\n", "\r\n")
+            f"{crlf_body}"
         )
         sections = extract_sections(raw)
         hc = sections[0].content
@@ -638,10 +668,10 @@ class TestDeidentifyAndReassemble(SimpleTestCase):
         anns = [FakeAnnotation(0, start, end, "[email_1]")]
         result = deidentify_and_reassemble(raw, sections, group_annotations_by_section(anns))
         msg = email.message_from_string(result)
-        decoded_body = msg.get_payload(decode=True).decode("utf-8")
+        payload = msg.get_payload(decode=True)
         # Body should be completely untouched
-        self.assertIn("This is the original body content.", decoded_body)
-        self.assertIn("With multiple lines.", decoded_body)
+        self.assertIn(b"This is the original body content.", payload)
+        self.assertIn(b"With multiple lines.", payload)
 
     def test_content_type_not_corrupted_by_nearby_annotation(self):
         """Annotation near Content-Type header does not corrupt MIME type detection."""
@@ -656,9 +686,8 @@ class TestDeidentifyAndReassemble(SimpleTestCase):
         hc = sections[0].content
         # Annotate email in X-Mailer header (adjacent to Content-Type)
         target = "alice@example.com"
-        # Find the second occurrence (in X-Mailer, not From)
-        first_end = hc.find(target) + len(target)
-        start = hc.find(target, first_end)
+        # Use the second occurrence (in X-Mailer, not From)
+        start = _locate(hc, target, nth=1)
         end = start + len(target)
         anns = [FakeAnnotation(0, start, end, "[email_1]")]
         result = deidentify_and_reassemble(raw, sections, group_annotations_by_section(anns))
@@ -689,22 +718,15 @@ class TestDeidentifyAndReassemble(SimpleTestCase):
         # Header annotation
         h_start = hc.find("alice@example.com")
         h_end = h_start + len("alice@example.com")
-        # Body annotations (text/plain)
-        plain_content = sections[1].content
-        phone_start_plain = plain_content.find("555-0100")
-        name_start_plain = plain_content.find("Alice")
-        # Body annotations (text/html)
-        html_content = sections[2].content
-        phone_start_html = html_content.find("555-0100")
-        name_start_html = html_content.find("Alice")
+        # Body annotations (text/plain, text/html)
+        body_tags = {"555-0100": "[phone_1]", "Alice": "[name_1]"}
 
         anns = [
             FakeAnnotation(0, h_start, h_end, "[email_1]"),
-            FakeAnnotation(1, phone_start_plain, phone_start_plain + len("555-0100"), "[phone_1]"),
-            FakeAnnotation(1, name_start_plain, name_start_plain + len("Alice"), "[name_1]"),
-            FakeAnnotation(2, phone_start_html, phone_start_html + len("555-0100"), "[phone_1]"),
-            FakeAnnotation(2, name_start_html, name_start_html + len("Alice"), "[name_1]"),
+            *_annotate(1, sections[1].content, body_tags),
+            *_annotate(2, sections[2].content, body_tags),
         ]
+        self.assertEqual(len(anns), 5)
         result = deidentify_and_reassemble(raw, sections, group_annotations_by_section(anns))
 
         # All tags present
@@ -712,8 +734,7 @@ class TestDeidentifyAndReassemble(SimpleTestCase):
         self.assertIn("[phone_1]", result)
         self.assertIn("[name_1]", result)
         # All PII removed
-        self.assertNotIn("alice@example.com", result)
-        self.assertNotIn("555-0100", result)
+        self._assert_none_present(result, ["alice@example.com", "555-0100"])
 
         # Structural integrity
         msg = self._assert_parsable(result, expect_multipart=True)
@@ -787,9 +808,7 @@ class TestDeidentifyAndReassemble(SimpleTestCase):
             )
 
         # 2. No original PII remains
-        unique_pii = {pii for _, pii, _ in pii_targets}
-        for pii in unique_pii:
-            self.assertNotIn(pii, result)
+        self._assert_none_present(result, {pii for _, pii, _ in pii_targets})
 
         # 3. Total tag count matches annotation count
         total_tags = sum(result.count(tag) for _, _, tag in pii_targets)
@@ -798,6 +817,43 @@ class TestDeidentifyAndReassemble(SimpleTestCase):
         # 4. Structural integrity
         self._assert_parsable(result, expect_multipart=True)
 
+    def test_reused_message_matches_fresh_parse(self):
+        html_b64 = base64.b64encode(b"<p>Call me at 555-1234</p>").decode("ascii")
+        raw = (
+            "From: alice@example.com\r\n"
+            "Content-Type: multipart/alternative; boundary=abc123\r\n"
+            "\r\n"
+            "--abc123\r\n"
+            "Content-Type: text/plain; charset=utf-8\r\n"
+            "\r\n"
+            "Call me at 555-1234\r\n"
+            "--abc123\r\n"
+            "Content-Type: text/html; charset=utf-8\r\n"
+            "Content-Transfer-Encoding: base64\r\n"
+            "\r\n"
+            f"{html_b64}\r\n"
+            "--abc123--\r\n"
+        )
+        body_anns = group_annotations_by_section([
+            FakeAnnotation(1, 11, 19, "[phone_1]"),
+            FakeAnnotation(2, 14, 22, "[phone_1]"),
+        ])
+        header_anns = group_annotations_by_section([
+            FakeAnnotation(0, 6, 23, "[email_1]"),
+            FakeAnnotation(1, 11, 19, "[phone_1]"),
+        ])
+
+        for anns_by_section in (body_anns, header_anns, {}):
+            with self.subTest(sections=sorted(anns_by_section)):
+                expected = deidentify_and_reassemble(
+                    raw, extract_sections(raw), anns_by_section
+                )
+                sections, msg = extract_sections_and_message(raw)
+                result = deidentify_and_reassemble(
+                    raw, sections, anns_by_section, msg
+                )
+                self.assertEqual(result, expected)
+
 
 class TestGroupAnnotationsBySection(SimpleTestCase):
     def test_grouping(self):
@@ -0,0 +1,145 @@
+"""Tests for the PlatformSetting helpers in core.settings_views."""
+
+import json
+import tempfile
+
+from django.test import TestCase, override_settings
+
+from accounts.models import User
+
+from core.settings_views import (
+    MAX_DISCARD_REASON_LENGTH,
+    MAX_DISCARD_REASONS,
+    MAX_DISCARD_REASONS_BODY_SIZE,
+    get_blind_review_enabled,
+    get_discard_reasons,
+    get_min_annotation_length,
+    get_settings,
+    save_setting,
+)
+
+
+def as_worker(name):
+    """Run with the per-process LocMemCache a gunicorn worker called name has."""
+    return override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": name,
+            }
+        }
+    )
+
+
+class TestSettingsAcrossWorkers(TestCase):
+    """A setting saved by one worker applies immediately in every other one."""
+
+    def test_blind_review_not_stale_in_other_worker(self):
+        with as_worker("worker-1"):
+            self.assertFalse(get_blind_review_enabled())
+        with as_worker("worker-2"):
+            save_setting("blind_review", "true")
+        with as_worker("worker-1"):
+            self.assertTrue(get_blind_review_enabled())
+
+    def test_min_annotation_length_not_stale_in_other_worker(self):
+        with as_worker("worker-1"):
+            self.assertEqual(get_min_annotation_length(), 1)
+        with as_worker("worker-2"):
+            save_setting("min_annotation_length", "5")
+        with as_worker("worker-1"):
+            self.assertEqual(get_min_annotation_length(), 5)
+
+    def test_discard_reasons_not_stale_in_other_worker(self):
+        with as_worker("worker-1"):
+            self.assertIn("Other", get_discard_reasons())
+        with as_worker("worker-2"):
+            save_setting("discard_reasons", '["Spam"]')
+        with as_worker("worker-1"):
+            self.assertEqual(get_discard_reasons(), ["Spam"])
+
+
+class TestSettingsWithSharedCache(TestCase):
+    """A shared cache backend serves repeated reads and is invalidated on save."""
+
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        shared = override_settings(
+            CACHES={
+                "default": {
+                    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                    "LOCATION": cache_dir.name,
+                }
+            }
+        )
+        shared.enable()
+        self.addCleanup(shared.disable)
+
+    def test_blind_review_cached_and_invalidated(self):
+        self.assertFalse(get_blind_review_enabled())
+        with self.assertNumQueries(0):
+            self.assertFalse(get_blind_review_enabled())
+        save_setting("blind_review", "true")
+        self.assertTrue(get_blind_review_enabled())
+
+    def test_min_annotation_length_cached_and_invalidated(self):
+        self.assertEqual(get_min_annotation_length(), 1)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_min_annotation_length(), 1)
+        save_setting("min_annotation_length", "5")
+        self.assertEqual(get_min_annotation_length(), 5)
+
+    def test_get_settings_loads_misses_in_one_query(self):
+        with self.assertNumQueries(1):
+            values = get_settings()
+        self.assertEqual(
+            values,
+            {
+                "blind_review": False,
+                "min_annotation_length": 1,
+                "discard_reasons": get_discard_reasons(),
+            },
+        )
+        with self.assertNumQueries(0):
+            get_settings()
+
+
+class TestDiscardReasonsLimits(TestCase):
+    def setUp(self):
+        admin = User.objects.create_user("admin@example.com", "Admin", "pw", role="ADMIN")
+        self.client.force_login(admin)
+
+    def _put(self, reasons):
+        return self.client.put(
+            "/api/settings/discard-reasons/",
+            json.dumps({"reasons": reasons}),
+            content_type="application/json",
+        )
+
+    def test_too_many_reasons_is_a_validation_error(self):
+        response = self._put(["x"] * (MAX_DISCARD_REASONS + 1))
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("reasons", response.json())
+
+    def test_too_long_reason_is_a_validation_error(self):
+        response = self._put(["x" * (MAX_DISCARD_REASON_LENGTH + 1)])
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("reasons", response.json())
+
+    def test_oversized_body_is_rejected(self):
+        response = self._put(["x" * MAX_DISCARD_REASONS_BODY_SIZE])
+        self.assertEqual(response.status_code, 413)
+
+    def test_valid_reasons_saved(self):
+        response = self._put([" Spam ", "Other"])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(get_discard_reasons(), ["Spam", "Other"])
+
+    def test_non_admin_cannot_update(self):
+        annotator = User.objects.create_user(
+            "annotator@example.com", "Annotator", "pw", role="ANNOTATOR"
+        )
+        self.client.force_login(annotator)
+        self.assertEqual(self.client.get("/api/settings/discard-reasons/").status_code, 200)
+        self.assertEqual(self._put(["Spam"]).status_code, 403)
@@ -1,5 +1,3 @@
-import re
-
 from django.db import transaction
 from django.db.models import Q
 from django.db.models.functions import Replace
@@ -21,6 +19,7 @@ from .serializers import (
     CreateExcludedFileHashSerializer,
     ExcludedFileHashSerializer,
     RenameAnnotationClassSerializer,
+    SHA256_HEX_RE,
     UpdateAnnotationClassSerializer,
 )
 
@@ -239,14 +238,13 @@ class ExcludedFileHashViewSet(ViewSet):
         created = 0
         skipped = 0
         errors = []
-        hex_pattern = re.compile(r"^[0-9a-f]{64}$")
 
         to_create = []
         seen = set()
 
         for i, item in enumerate(items):
             content_hash = str(item.get("content_hash", "")).lower().strip()
-            if not hex_pattern.match(content_hash):
+            if not SHA256_HEX_RE.match(content_hash):
                 errors.append({"index": i, "error": "Invalid SHA-256 hash."})
                 continue
             if content_hash in seen:
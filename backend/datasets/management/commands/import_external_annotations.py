@@ -10,7 +10,7 @@ from django.db import transaction
 from accounts.models import User
 from annotations.models import Annotation, AnnotationVersion
 from core.models import AnnotationClass
-from core.section_extractor import extract_sections
+from core.section_extractor import extract_sections_and_message
 from core.section_reassembler import (
     deidentify_and_reassemble,
     group_annotations_by_section,
@@ -314,7 +314,7 @@ class Command(BaseCommand):
             eml_text = raw_bytes.decode("latin-1")
 
         # Extract sections for section-based offset mapping
-        sections = extract_sections(eml_text)
+        sections, msg = extract_sections_and_message(eml_text)
 
         # Sort annotations by start_offset for sequential matching
         annotations_data.sort(key=lambda a: a["start_offset"])
@@ -470,7 +470,7 @@ class Command(BaseCommand):
                 ]
                 ann_by_section = group_annotations_by_section(ns_annotations)
                 result = deidentify_and_reassemble(
-                    eml_text, sections, ann_by_section
+                    eml_text, sections, ann_by_section, msg
                 )
                 if not result or not result.strip():
                     redaction_error = "Empty output from deidentify_and_reassemble"
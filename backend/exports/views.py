@@ -15,7 +15,10 @@ from rest_framework.viewsets import ViewSet
 from annotations.models import Annotation, AnnotationVersion
 from annotations.serializers import AnnotationSerializer
 from core.permissions import IsAdmin
-from core.section_extractor import extract_sections
+from core.section_extractor import (
+    extract_sections,
+    extract_sections_and_message,
+)
 from core.section_reassembler import (
     deidentify_and_reassemble,
     group_annotations_by_section,
@@ -45,13 +48,15 @@ class ExportViewSet(ViewSet):
 
         Returns (deidentified_eml_str, annotations_list).
         """
-        sections = extract_sections(job.eml_content)
         latest_version = (
             job.annotation_versions.order_by("-version_number").first()
         )
         if not latest_version:
             return job.eml_content, []
 
+        raw_content = job.eml_content
+        sections, msg = extract_sections_and_message(raw_content)
+
         annotations = list(
             latest_version.annotations.select_related(
                 "annotation_class"
@@ -59,7 +64,7 @@ class ExportViewSet(ViewSet):
         )
         anns_by_section = group_annotations_by_section(annotations)
         deidentified = deidentify_and_reassemble(
-            job.eml_content, sections, anns_by_section
+            raw_content, sections, anns_by_section, msg
         )
         return deidentified, annotations
 
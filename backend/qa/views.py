@@ -9,9 +9,12 @@ from rest_framework.response import Response
 from rest_framework.viewsets import ViewSet
 
 from annotations.models import Annotation, AnnotationVersion
-from core.models import PlatformSetting
 from core.section_extractor import extract_sections
-from core.settings_views import get_discard_reasons
+from core.settings_views import (
+    get_blind_review_enabled,
+    get_discard_reasons,
+    get_min_annotation_length,
+)
 from core.permissions import IsQA
 from datasets.models import Job
 from .models import QADraftReview, QAReviewVersion
@@ -41,18 +44,10 @@ class QAViewSet(ViewSet):
     permission_classes = [IsAuthenticated, IsQA]
 
     def _get_blind_review_setting(self):
-        try:
-            setting = PlatformSetting.objects.get(key="blind_review")
-            return setting.value.lower() in ("true", "1", "yes")
-        except PlatformSetting.DoesNotExist:
-            return False
+        return get_blind_review_enabled()
 
     def _get_min_annotation_length(self):
-        try:
-            setting = PlatformSetting.objects.get(key="min_annotation_length")
-            return max(1, int(setting.value))
-        except (PlatformSetting.DoesNotExist, ValueError):
-            return 1
+        return get_min_annotation_length()
 
     def _get_job(self, job_id, user, allowed_statuses=None):
         """Fetch a job and validate QA assignment. Returns (job, error_response)."""
@@ -230,7 +225,7 @@ class QAViewSet(ViewSet):
                 )
                 for ann in data["modified_annotations"]
             ]
-            Annotation.objects.bulk_create(annotation_objects)
+            Annotation.objects.bulk_create(annotation_objects, batch_size=500)
             review_annotation_version = qa_version
         else:
             review_annotation_version = latest_annotation_version
@@ -57,11 +57,9 @@ import {
 } from "@/components/ui/tabs";
 import { TableSkeleton } from "@/components/table-skeleton";
 import { EmptyState } from "@/components/empty-state";
-import { useBlindReviewSetting } from "@/features/dashboard/api/get-blind-review-setting";
+import { useAllSettings } from "@/features/dashboard/api/get-all-settings";
 import { useUpdateBlindReviewSetting } from "@/features/dashboard/api/update-blind-review-setting";
-import { useMinAnnotationLengthSetting } from "@/features/dashboard/api/get-min-annotation-length-setting";
 import { useUpdateMinAnnotationLengthSetting } from "@/features/dashboard/api/update-min-annotation-length-setting";
-import { useDiscardReasons } from "@/features/dashboard/api/get-discard-reasons-setting";
 import { useUpdateDiscardReasons } from "@/features/dashboard/api/update-discard-reasons-setting";
 import { useExcludedHashes } from "@/features/dashboard/api/get-excluded-hashes";
 import { useCreateExcludedHash } from "@/features/dashboard/api/create-excluded-hash";
@@ -77,43 +75,43 @@ const SHA256_RE = /^[a-f0-9]{64}$/i;
 const MAX_CSV_SIZE = 5 * 1024 * 1024; // 5MB
 const MIN_LENGTH_MIN = 1;
 const MIN_LENGTH_MAX = 500;
+const MAX_DISCARD_REASON_LENGTH = 200;
 
 function SettingsPage() {
-  const { data: blindReview, isLoading } = useBlindReviewSetting();
+  const { data: settings, isLoading } = useAllSettings();
   const updateBlindReview = useUpdateBlindReviewSetting();
   const [blindReviewPending, setBlindReviewPending] = useState<boolean | null>(
     null,
   );
 
-  const { data: minLengthSetting, isLoading: minLengthLoading } =
-    useMinAnnotationLengthSetting();
   const updateMinLength = useUpdateMinAnnotationLengthSetting();
   const [minLengthValue, setMinLengthValue] = useState<number>(1);
 
+  const savedMinLength = settings?.minAnnotationLength;
+
   useEffect(() => {
-    if (minLengthSetting) {
-      setMinLengthValue(minLengthSetting.minLength);
+    if (savedMinLength !== undefined) {
+      setMinLengthValue(savedMinLength);
     }
-  }, [minLengthSetting]);
+  }, [savedMinLength]);
 
-  const minLengthChanged = minLengthSetting
-    ? minLengthValue !== minLengthSetting.minLength
-    : false;
+  const minLengthChanged =
+    savedMinLength !== undefined ? minLengthValue !== savedMinLength : false;
 
-  const { data: discardReasonsData, isLoading: discardReasonsLoading } =
-    useDiscardReasons();
   const updateDiscardReasons = useUpdateDiscardReasons();
   const [localReasons, setLocalReasons] = useState<string[]>([]);
   const [newReason, setNewReason] = useState("");
 
+  const savedReasons = settings?.discardReasons;
+
   useEffect(() => {
-    if (discardReasonsData) {
-      setLocalReasons(discardReasonsData.reasons);
+    if (savedReasons) {
+      setLocalReasons(savedReasons);
     }
-  }, [discardReasonsData]);
+  }, [savedReasons]);
 
-  const discardReasonsChanged = discardReasonsData
-    ? JSON.stringify(localReasons) !== JSON.stringify(discardReasonsData.reasons)
+  const discardReasonsChanged = savedReasons
+    ? JSON.stringify(localReasons) !== JSON.stringify(savedReasons)
     : false;
 
   const hasUnsavedChanges = minLengthChanged || discardReasonsChanged;
@@ -267,7 +265,7 @@ function SettingsPage() {
                     </div>
                     <Switch
                       id="blind-review"
-                      checked={blindReview?.enabled ?? false}
+                      checked={settings?.blindReview ?? false}
                       onCheckedChange={handleToggleBlindReview}
                       disabled={isLoading || updateBlindReview.isPending}
                       data-testid="blind-review-toggle"
@@ -301,7 +299,7 @@ function SettingsPage() {
                     text selection. Annotations shorter than this will be
                     rejected.
                   </p>
-                  {minLengthLoading ? (
+                  {isLoading ? (
                     <Skeleton className="h-9 w-24" />
                   ) : (
                     <>
@@ -361,7 +359,7 @@ function SettingsPage() {
             </CardHeader>
             <CardContent>
               <div className="space-y-3">
-                {discardReasonsLoading ? (
+                {isLoading ? (
                   <div className="space-y-3">
                     <Skeleton className="h-8 w-full" />
                     <Skeleton className="h-8 w-full" />
@@ -410,6 +408,7 @@ function SettingsPage() {
                       <Input
                         placeholder="Add a reason..."
                         value={newReason}
+                        maxLength={MAX_DISCARD_REASON_LENGTH}
                         onChange={(e) => setNewReason(e.target.value)}
                         onKeyDown={(e) => {
                           if (e.key === "Enter") {
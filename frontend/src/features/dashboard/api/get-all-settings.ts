@@ -0,0 +1,24 @@
+import { useQuery } from "@tanstack/react-query";
+import { apiClient } from "@/lib/api-client";
+
+interface AllSettings {
+  blindReview: boolean;
+  minAnnotationLength: number;
+  discardReasons: string[];
+}
+
+async function getAllSettings(): Promise<AllSettings> {
+  const response = await apiClient.get("/settings/all/");
+  return {
+    blindReview: response.data.blind_review,
+    minAnnotationLength: response.data.min_annotation_length,
+    discardReasons: response.data.discard_reasons,
+  };
+}
+
+export function useAllSettings() {
+  return useQuery({
+    queryKey: ["settings", "all"],
+    queryFn: getAllSettings,
+  });
+}
@@ -18,7 +18,7 @@ export function useUpdateBlindReviewSetting() {
   return useMutation({
     mutationFn: updateBlindReviewSetting,
     onSuccess: () => {
-      queryClient.invalidateQueries({ queryKey: ["settings", "blind-review"] });
+      queryClient.invalidateQueries({ queryKey: ["settings"] });
       toast.success("Setting updated");
     },
   });
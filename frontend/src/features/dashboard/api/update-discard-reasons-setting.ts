@@ -18,7 +18,7 @@ export function useUpdateDiscardReasons() {
   return useMutation({
     mutationFn: updateDiscardReasons,
     onSuccess: () => {
-      queryClient.invalidateQueries({ queryKey: ["settings", "discard-reasons"] });
+      queryClient.invalidateQueries({ queryKey: ["settings"] });
       toast.success("Discard reasons updated");
     },
   });
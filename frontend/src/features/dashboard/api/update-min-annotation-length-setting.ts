@@ -20,7 +20,7 @@ export function useUpdateMinAnnotationLengthSetting() {
   return useMutation({
     mutationFn: updateMinAnnotationLengthSetting,
     onSuccess: () => {
-      queryClient.invalidateQueries({ queryKey: ["settings", "min-annotation-length"] });
+      queryClient.invalidateQueries({ queryKey: ["settings"] });
       toast.success("Minimum annotation length updated");
     },
   });